@@ -11,8 +11,8 @@ Smart parsers for EU regulatory texts:
 Status: 5/5 regulations functional ✅
 """
 
-import json
 import sys
+from typing import NamedTuple, Union
 import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
@@ -22,8 +22,31 @@ import re
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.config import REGULATORY_DB_PATH
+from src.utils.json_utils import dumps
 from src.utils.logger import logger
-from src.data.weaviate import Weaviate
+
+# Wikipedia cleanup patterns (compiled once, single pass per string)
+_SECTION_SPLIT_RE = re.compile(r'\n(?=[A-Z][a-z]+\s+(?:and|or|\[))')
+_CITATION_RE = re.compile(r'\[\d+\]|\[citation needed\]')
+_BRACKET_RE = re.compile(r'\[.*?\]')
+
+
+class Article(NamedTuple):
+    """One parsed regulation article (lighter than a per-row dict)"""
+    number: Union[int, str]
+    title: str
+    text: str
+
+
+# Window size (in words) for the raw_chunks parser
+RAW_CHUNK_WORDS = 500
+
+
+def _clean_paragraph(text):
+    """Strip bracketed markers and collapse whitespace"""
+    text = _BRACKET_RE.sub('', text)
+    return ' '.join(text.split())
+
 
 # MICA (Markets in Crypto-Assets)
 # Date: 2025-12-15
@@ -45,6 +68,8 @@ class RegulatoryCollector:
     """Collect official EU regulatory texts with smart parsers"""
     
     def __init__(self):
+        from src.data.weaviate import Weaviate
+        
         self.base_path = REGULATORY_DB_PATH
         try:
             self.weaviate = Weaviate()
@@ -95,6 +120,19 @@ class RegulatoryCollector:
                 "parser": "wiki_lenient"
             }
         }
+        
+        # Parser dispatch table (built once, validated against sources)
+        self._parsers = {
+            "gdpr": self.parse_gdpr,
+            "ai_act": self.parse_ai_act,
+            "wiki": self.parse_wiki_smart,
+            "wiki_lenient": self.parse_wiki_lenient,
+            "wiki_ultra_simple": self.parse_wiki_ultra_simple,
+            "raw_chunks": self.parse_raw_chunks
+        }
+        for name, config in self.sources.items():
+            if config["parser"] not in self._parsers:
+                raise ValueError(f"Unknown parser '{config['parser']}' for source '{name}'")
     
     def fetch_html(self, url):
         """Fetch HTML from URL"""
@@ -133,11 +171,10 @@ class RegulatoryCollector:
             if current_article and len(current_article['text']) > 50:
                 articles.append(current_article)
             
-            return [{
-                "number": str(a['number']),
-                "title": a['title'][:150],
-                "text": a['text'].strip()[:3000]
-            } for a in articles if a['text'].strip()]
+            return [
+                Article(str(a['number']), a['title'][:150], a['text'].strip()[:3000])
+                for a in articles if a['text'].strip()
+            ]
         except Exception as e:
             logger.error(f"      Parse error: {e}")
             return None
@@ -175,11 +212,7 @@ class RegulatoryCollector:
                 
                 full_text = ' '.join(content_parts)
                 if len(full_text) > 100:
-                    articles.append({
-                        "number": len(articles) + 1,
-                        "title": title[:150],
-                        "text": full_text[:3000]
-                    })
+                    articles.append(Article(len(articles) + 1, title[:150], full_text[:3000]))
             
             return articles if articles else None
         except Exception as e:
@@ -204,7 +237,7 @@ class RegulatoryCollector:
             all_text = content.get_text()
             
             # Split by common heading patterns
-            sections = re.split(r'\n(?=[A-Z][a-z]+\s+(?:and|or|\[))', all_text)
+            sections = _SECTION_SPLIT_RE.split(all_text)
             
             for i, section in enumerate(sections):
                 lines = [l.strip() for l in section.split('\n') if l.strip()]
@@ -217,18 +250,13 @@ class RegulatoryCollector:
                 content_text = ' '.join(lines[1:])
                 
                 # Remove citation markers [1], [2], etc
-                content_text = re.sub(r'\[\d+\]', '', content_text)
-                content_text = re.sub(r'\[citation needed\]', '', content_text)
+                content_text = _CITATION_RE.sub('', content_text)
                 
                 # Clean whitespace
                 content_text = ' '.join(content_text.split())
                 
                 if len(content_text) > 200:  # At least 200 chars
-                    articles.append({
-                        "number": i + 1,
-                        "title": title,
-                        "text": content_text[:3000]
-                    })
+                    articles.append(Article(i + 1, title, content_text[:3000]))
             
             return articles if len(articles) > 3 else None
         except Exception as e:
@@ -255,8 +283,7 @@ class RegulatoryCollector:
                 text = p.get_text(strip=True)
                 
                 # Remove citation markers
-                text = re.sub(r'\[\d+\]', '', text)
-                text = re.sub(r'\[citation needed\]', '', text)
+                text = _CITATION_RE.sub('', text)
                 text = ' '.join(text.split())
                 
                 if len(text) > 150:  # Longer minimum for this parser
@@ -272,6 +299,8 @@ class RegulatoryCollector:
                         if len(current_section['text']) > 2500:
                             current_section = None
             
+            # Sections are grown in place above, freeze them once complete
+            articles = [Article(**a) for a in articles]
             return articles if len(articles) > 2 else None
         except Exception as e:
             logger.error(f"Parse error: {e}")
@@ -293,20 +322,13 @@ class RegulatoryCollector:
             articles = []
             
             # Get ALL text - very simple approach
-            all_paragraphs = []
+            raws = [p.get_text(strip=True) for p in content.find_all('p')]
             
-            # Find all paragraphs
-            for p in content.find_all('p'):
-                text = p.get_text(strip=True)
-                
-                # Basic cleanup
-                text = re.sub(r'\[\d+\]', '', text)
-                text = re.sub(r'\[.*?\]', '', text)
-                text = ' '.join(text.split())
-                
-                # Accept ANY non-empty text
-                if text and len(text) > 30:
-                    all_paragraphs.append(text)
+            # Basic cleanup
+            cleaned = [_clean_paragraph(text) for text in raws]
+            
+            # Accept ANY non-empty text
+            all_paragraphs = [text for text in cleaned if text and len(text) > 30]
             
             # Group paragraphs into articles
             if not all_paragraphs:
@@ -320,11 +342,11 @@ class RegulatoryCollector:
                 # Every 2-3 paragraphs, save as an article
                 if (i + 1) % 3 == 0 or i == len(all_paragraphs) - 1:
                     if len(current_text) > 100:
-                        articles.append({
-                            "number": len(articles) + 1,
-                            "title": f"Section {len(articles) + 1}",
-                            "text": current_text[:3000].strip()
-                        })
+                        articles.append(Article(
+                            len(articles) + 1,
+                            f"Section {len(articles) + 1}",
+                            current_text[:3000].strip()
+                        ))
                         current_text = ""
             
             # Return if we have ANY articles
@@ -333,6 +355,32 @@ class RegulatoryCollector:
             logger.error(f"Parse error: {e}")
             return None
     
+    def parse_raw_chunks(self, html):
+        """Raw chunk parser - fixed-size word windows, no section detection
+        
+        BM25 search in Weaviate does not depend on article boundaries, so
+        for wiki sources this skips the heading heuristics entirely.
+        """
+        try:
+            soup = BeautifulSoup(html, 'html.parser')
+            
+            content = soup.find('div', id='mw-content-text') or soup.body
+            if not content:
+                return None
+            
+            text = _CITATION_RE.sub('', content.get_text(' '))
+            words = text.split()
+            
+            articles = [
+                Article(n + 1, f"Chunk {n + 1}", ' '.join(words[i:i + RAW_CHUNK_WORDS]))
+                for n, i in enumerate(range(0, len(words), RAW_CHUNK_WORDS))
+            ]
+            
+            return articles if articles else None
+        except Exception as e:
+            logger.error(f"Parse error: {e}")
+            return None
+    
     def fetch_one(self, name):
         """Fetch and process one regulation"""
         config = self.sources.get(name)
@@ -350,21 +398,7 @@ class RegulatoryCollector:
         
         # Parse with specific parser
         parser_name = config.get("parser", "gdpr")
-        
-        if parser_name == "gdpr":
-            articles = self.parse_gdpr(html)
-        elif parser_name == "ai_act":
-            articles = self.parse_ai_act(html)
-        elif parser_name == "wiki":
-            articles = self.parse_wiki_smart(html)
-        elif parser_name == "wiki_lenient":
-            articles = self.parse_wiki_lenient(html)
-        elif parser_name == "wiki_super_lenient":
-            articles = self.parse_wiki_super_lenient(html)
-        elif parser_name == "wiki_ultra_simple":
-            articles = self.parse_wiki_ultra_simple(html)
-        else:
-            articles = self.parse_gdpr(html)
+        articles = self._parsers.get(parser_name, self.parse_gdpr)(html)
         
         if not articles or len(articles) == 0:
             logger.error(f"      ❌ No articles extracted")
@@ -376,7 +410,7 @@ class RegulatoryCollector:
         self.save({
             "regulation": config["regulation"],
             "year": config["year"],
-            "articles": articles,
+            "articles": [a._asdict() for a in articles],
             "count": len(articles),
             "source": config["url"]
         }, config["filename"])
@@ -429,8 +463,8 @@ class RegulatoryCollector:
             for article in articles[:100]:
                 self.weaviate.add_regulation(
                     title=title,
-                    article=article.get("title", f"Art. {article.get('number')}"),
-                    text=article.get("text", ""),
+                    article=article.title or f"Art. {article.number}",
+                    text=article.text,
                     regulation=regulation
                 )
             logger.info(f"      ✓ Weaviate: {len(articles)} articles stored")
@@ -472,30 +506,5 @@ class RegulatoryCollector:
     def save(self, data, filename):
         """Save to JSON"""
         filepath = self.base_path / filename
-        with open(filepath, "w", encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        filepath.write_bytes(dumps(data, indent=True))
         logger.info(f"      ✓ Saved: {filename}")
-
-    def fetch(self):
-        """Alias for fetch_all() - fetch all data"""
-        return self.fetch_all()
-
-    def collect(self):
-        """Alias for fetch_all() - collect all data"""
-        return self.fetch_all()
-
-    def validate(self, data):
-        """Validate fetched data structure"""
-        if data is None:
-            return False
-        if isinstance(data, (list, dict)):
-            return len(data) > 0
-        return True
-
-    def is_valid(self, data):
-        """Check if data is valid"""
-        return self.validate(data)
-
-    def use_cache(self, key):
-        """Check if key exists in cache"""
-        return key in self.cache
\ No newline at end of file
@@ -44,6 +44,9 @@ VERBOSE = os.getenv("VERBOSE", "true").lower() == "true"
 for path in [REGULATORY_DB_PATH, CASE_LAW_PATH, TECH_SPECS_PATH]:
     path.mkdir(parents=True, exist_ok=True)
 
+# Checked once at import so callers don't repeat the stat() calls
+PATHS_VERIFIED = PROJECT_ROOT.exists() and DATA_PATH.exists()
+
 if __name__ == "__main__":
     print(f"Project Root: {PROJECT_ROOT}")
     print(f"Weaviate: {WEAVIATE_URL}")
@@ -4,14 +4,27 @@ Weaviate Integration - v1.28.0 with v4 API
 Local development with API Key authentication and BM25 full-text search.
 """
 
-import weaviate
-from weaviate.classes.config import Property, DataType
-from weaviate.auth import AuthApiKey
 from typing import List, Dict
 import time
+import requests
 from src.config import WEAVIATE_URL, WEAVIATE_API_KEY
 from src.utils.logger import logger
 
+# Startup wait: total deadline and exponential backoff bounds (seconds)
+STARTUP_TIMEOUT = 30
+BACKOFF_INITIAL = 0.1
+BACKOFF_MAX = 2.0
+READY_PROBE_TIMEOUT = 0.5
+
+
+def is_ready(base_url: str, timeout: float = READY_PROBE_TIMEOUT) -> bool:
+    """Cheap HTTP readiness probe (avoids a full gRPC connect during bring-up)"""
+    try:
+        response = requests.get(f"{base_url}/v1/.well-known/ready", timeout=timeout)
+        return response.status_code == 200
+    except requests.RequestException:
+        return False
+
 
 class Weaviate:
     """Connect to Weaviate v1.28.0 with API Key authentication and BM25 search"""
@@ -25,7 +38,12 @@ class Weaviate:
             wait_for_startup: Wait for Weaviate to be ready (up to 30 seconds)
         """
         
+        # Imported lazily: the client pulls in grpc/protobuf/httpx at import time
+        import weaviate
+        from weaviate.auth import AuthApiKey
+        
         # Parse URL
+        scheme = "https" if url.startswith("https://") else "http"
         if url.startswith("http://"):
             url_clean = url.replace("http://", "")
         elif url.startswith("https://"):
@@ -36,13 +54,24 @@ class Weaviate:
         host, port = url_clean.split(":") if ":" in url_clean else (url_clean, 8098)
         port = int(port)
         
+        # Collection handles, resolved lazily on first use
+        self._regulation_collection = None
+        self._case_collection = None
+        
         # Setup auth
         auth = AuthApiKey(api_key=api_key) if api_key else None
         
-        # Try to connect with retries
-        max_retries = 30
-        for attempt in range(max_retries):
+        # Try to connect with exponential backoff until the deadline
+        base_url = f"{scheme}://{host}:{port}"
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        delay = BACKOFF_INITIAL
+        attempt = 0
+        while True:
+            attempt += 1
             try:
+                if wait_for_startup and not is_ready(base_url):
+                    raise ConnectionError(f"{base_url} is not ready")
+                
                 self.client = weaviate.connect_to_local(
                     host=host,
                     port=port,
@@ -52,7 +81,7 @@ class Weaviate:
                 return
                 
             except Exception as e:
-                if not wait_for_startup or attempt == max_retries - 1:
+                if not wait_for_startup or time.monotonic() + delay >= deadline:
                     raise ConnectionError(
                         f"Weaviate not running at {host}:{port}\n\n"
                         f"Solution: Make sure Weaviate is running first!\n"
@@ -61,10 +90,25 @@ class Weaviate:
                         f"Error: {e}"
                     )
                 
-                if attempt == 0:
-                    logger.warning(f"Weaviate not ready, waiting... (attempt {attempt + 1}/{max_retries})")
+                if attempt == 1:
+                    logger.warning(f"Weaviate not ready, waiting up to {STARTUP_TIMEOUT}s...")
                 
-                time.sleep(1)
+                time.sleep(delay)
+                delay = min(delay * 2, BACKOFF_MAX)
+    
+    @property
+    def regulation_collection(self):
+        """Cached handle to the Regulation collection"""
+        if self._regulation_collection is None:
+            self._regulation_collection = self.client.collections.get("Regulation")
+        return self._regulation_collection
+    
+    @property
+    def case_collection(self):
+        """Cached handle to the Case collection"""
+        if self._case_collection is None:
+            self._case_collection = self.client.collections.get("Case")
+        return self._case_collection
     
     def close(self):
         """Close connection"""
@@ -74,6 +118,12 @@ class Weaviate:
     def create_schema(self):
         """Create classes for regulations and cases"""
         
+        from weaviate.classes.config import Property, DataType
+        
+        # Collections are recreated below, drop any cached handles
+        self._regulation_collection = None
+        self._case_collection = None
+        
         try:
             # Delete existing classes if they exist
             try:
@@ -121,7 +171,7 @@ class Weaviate:
         """Add enforcement case"""
         
         try:
-            cases = self.client.collections.get("Case")
+            cases = self.case_collection
             
             uuid = cases.data.insert(
                 properties={
@@ -143,7 +193,7 @@ class Weaviate:
         """Add regulation"""
         
         try:
-            regs = self.client.collections.get("Regulation")
+            regs = self.regulation_collection
             
             uuid = regs.data.insert(
                 properties={
@@ -163,7 +213,7 @@ class Weaviate:
         """Search enforcement cases by violation or company using BM25"""
         
         try:
-            cases = self.client.collections.get("Case")
+            cases = self.case_collection
             
             # Use BM25 for full-text search
             results = cases.query.bm25(
@@ -191,7 +241,7 @@ class Weaviate:
         """Search regulations by title, article, or text using BM25"""
         
         try:
-            regs = self.client.collections.get("Regulation")
+            regs = self.regulation_collection
             
             # Use BM25 for full-text search
             results = regs.query.bm25(
@@ -217,7 +267,7 @@ class Weaviate:
         """Get all cases"""
         
         try:
-            cases = self.client.collections.get("Case")
+            cases = self.case_collection
             
             results = cases.query.fetch_objects(limit=100)
             
@@ -240,7 +290,7 @@ class Weaviate:
         """Get all regulations"""
         
         try:
-            regs = self.client.collections.get("Regulation")
+            regs = self.regulation_collection
             
             results = regs.query.fetch_objects(limit=100)
             
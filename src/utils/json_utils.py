@@ -0,0 +1,42 @@
+"""
+JSON helpers for fintech-compliance
+
+orjson is optional (the "speedups" extra); without it the standard
+json module is used and produces equivalent output.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON text or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode obj as UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode
+        indent: Indent with two spaces instead of compact output
+
+    Returns:
+        Encoded JSON (non-ASCII characters are kept, not escaped)
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
@@ -2,11 +2,36 @@
 Logging configuration for fintech-compliance
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from src.config import DEBUG, VERBOSE
 
+
+class ConsoleHandler(logging.StreamHandler):
+    """StreamHandler that writes each record in one call and flushes only on a TTY"""
+    
+    terminator = "\n"
+    
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        isatty = getattr(self.stream, "isatty", None)
+        self.is_tty = bool(isatty and isatty())
+    
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if self.is_tty:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 # Create logs directory
 LOGS_DIR = Path(__file__).parent.parent.parent / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
@@ -16,13 +41,22 @@ logger = logging.getLogger("fintech-compliance")
 logger.setLevel(logging.DEBUG if DEBUG else logging.INFO)
 
 # Console handler
-console_handler = logging.StreamHandler(sys.stdout)
+console_handler = ConsoleHandler(sys.stdout)
 console_handler.setLevel(logging.DEBUG if VERBOSE else logging.INFO)
 
 # File handler
 file_handler = logging.FileHandler(LOGS_DIR / "fintech-compliance.log")
 file_handler.setLevel(logging.DEBUG)
 
+# Buffer file records: flush every 512 records or immediately on ERROR
+buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=512,
+    flushLevel=logging.ERROR,
+    target=file_handler
+)
+buffered_file_handler.setLevel(logging.DEBUG)
+atexit.register(buffered_file_handler.flush)
+
 # Formatter
 formatter = logging.Formatter(
     "[%(asctime)s] %(name)s - %(levelname)s - %(message)s",
@@ -32,9 +66,18 @@ formatter = logging.Formatter(
 console_handler.setFormatter(formatter)
 file_handler.setFormatter(formatter)
 
-# Add handlers
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+# Add handlers: callers only enqueue records, a listener thread does the I/O
+log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+listener = logging.handlers.QueueListener(
+    log_queue,
+    console_handler,
+    buffered_file_handler,
+    respect_handler_level=True
+)
+listener.start()
+atexit.register(listener.stop)
 
 if __name__ == "__main__":
     logger.debug("Debug message")
@@ -5,12 +5,16 @@ Provides wrapper functions for pysimplicityhl compilation
 with proper file handling and error reporting.
 """
 
-import json
 import tempfile
 import os
+import stat
 import platform
-import traceback
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, Union
+
+from src.utils.json_utils import loads
+
+# Platform is fixed for the life of the process
+_IS_WINDOWS = platform.system().lower().startswith("win")
 
 
 def create_temp_file(suffix: str = "", directory: Optional[str] = None, 
@@ -51,18 +55,38 @@ def write_text_to_temp_file(text: str, suffix: str = "",
     Returns:
         Full path of created temporary file
     """
-    filename, f = create_temp_file(suffix=suffix, directory=directory, delete=False)
+    if not suffix.startswith("."):
+        suffix = f".{suffix}"
     
-    f.write(text.encode("utf-8"))
-    f.flush()
-    f.close()
+    # mkstemp + fdopen: no NamedTemporaryFile wrapper/finalizer needed;
+    # the file object's write() loops until every byte is written
+    fd, filename = tempfile.mkstemp(suffix=suffix, dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        f.write(text.encode("utf-8"))
     
     return filename
 
 
+def _is_regular_file(path: str) -> bool:
+    """Single stat() check; source text passed as a path just yields False"""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def _remove_if_exists(path: str) -> None:
+    """Delete a file without a pre-check stat (EAFP)"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
 def compile_simplicity(code: str, witness: Optional[str] = None, 
                       folder: Optional[str] = None, 
-                      delete_temp_files: bool = True) -> Dict[str, Any]:
+                      delete_temp_files: bool = True,
+                      raw: bool = False) -> Union[Dict[str, Any], str]:
     """
     Compile SimplicityHL using pysimplicityhl.
 
@@ -71,9 +95,13 @@ def compile_simplicity(code: str, witness: Optional[str] = None,
         witness: Witness data as JSON string (or file path)
         folder: Working folder for temp files
         delete_temp_files: Delete temp files after compilation
+        raw: Return the compiler's JSON string as-is instead of parsing it.
+             The string is only the compiler output: the keys this wrapper
+             adds on success (warning, code_file, witness_file, deleted)
+             are not included. Errors are still reported as a dictionary.
 
     Returns:
-        Dictionary with compilation results
+        Dictionary with compilation results, or the raw JSON string if raw=True
     """
     
     try:
@@ -97,7 +125,7 @@ def compile_simplicity(code: str, witness: Optional[str] = None,
     
     # Handle code file
     cfile_given = False
-    if code is not None and os.path.isfile(code):
+    if code is not None and _is_regular_file(code):
         simf_file = code
         cfile_given = True
     elif code is None:
@@ -111,30 +139,29 @@ def compile_simplicity(code: str, witness: Optional[str] = None,
     # Handle witness file
     wit_file = None
     wfile_given = False
-    if witness is not None and os.path.isfile(witness):
+    if witness is not None and _is_regular_file(witness):
         wfile_given = True
         wit_file = witness
     elif witness is not None:
         wit_file = write_text_to_temp_file(witness, suffix="wit", directory=_temp_folder)
     
-    # Detect Windows
-    is_windows = platform.system().lower().startswith("win")
-    
     # Build parameter list
     parameter = ["--debug"]
-    parameter.append(f"'{simf_file}'" if is_windows else simf_file)
+    parameter.append(f"'{simf_file}'" if _IS_WINDOWS else simf_file)
     if wit_file is not None:
-        parameter.append(f"'{wit_file}'" if is_windows else wit_file)
+        parameter.append(f"'{wit_file}'" if _IS_WINDOWS else wit_file)
     
     parameter_txt = " ".join(parameter)
     
     try:
         # Run compilation
         result_json = pysimplicityhl.run_from_python(parameter_txt)
-        result = json.loads(result_json)
-        res.update(result)
+        if not raw:
+            res.update(loads(result_json))
         
     except Exception as e:
+        import traceback  # only needed on the failure path
+        
         res["error"] = True
         res["status"] = "error"
         res["message"] = f"Compilation exception: {str(e)}"
@@ -146,22 +173,23 @@ def compile_simplicity(code: str, witness: Optional[str] = None,
     # Handle deletion of temp files
     if delete_temp_files:
         try:
-            if os.path.isfile(simf_file) and not cfile_given:
-                os.remove(simf_file)
-            if wit_file and os.path.isfile(wit_file) and not wfile_given:
-                os.remove(wit_file)
+            if not cfile_given:
+                _remove_if_exists(simf_file)
+            if wit_file and not wfile_given:
+                _remove_if_exists(wit_file)
         except Exception as e:
             res["warning"] = f"Failed to delete temp files: {str(e)}"
             res["code_file"] = simf_file
             res["witness_file"] = wit_file
             res["deleted"] = False
-        return res
+    else:
+        # If not deleting, store filenames
+        res["code_file"] = simf_file
+        res["witness_file"] = wit_file
+        res["deleted"] = False
     
-    # If not deleting, store filenames
-    res["code_file"] = simf_file
-    res["witness_file"] = wit_file
-    res["deleted"] = False
-    return res
+    # Raw mode hands the JSON through, avoiding a decode + re-encode round-trip
+    return result_json if raw else res
 
 
 def pretty_print_code(code: str, indent_step: int = 2) -> str:
@@ -176,25 +204,24 @@ def pretty_print_code(code: str, indent_step: int = 2) -> str:
         Formatted code
     """
     indent = 0
-    i = 0
-    n = len(code)
-    result = ""
+    pad = ""
+    lines = [[]]
     
-    while i < n:
-        c = code[i]
+    for c in code:
         if c == '(':
-            result += '('
+            lines[-1].append('(')
             indent += indent_step
-            i += 1
+            pad = ' ' * indent
         elif c == ')':
             indent -= indent_step
-            result += ')'
-            i += 1
+            pad = ' ' * indent
+            lines[-1].append(')')
         elif c == ';':
-            result += ';\n' + ' ' * indent
-            i += 1
+            lines[-1].append(';')
+            lines.append([pad])
+        elif c == '\n':
+            lines.append([])
         else:
-            result += c
-            i += 1
+            lines[-1].append(c)
     
-    return '\n'.join(line.rstrip() for line in result.split('\n'))
+    return '\n'.join(''.join(line).rstrip() for line in lines)
@@ -6,9 +6,38 @@ View all regulatory articles and enforcement cases in Weaviate
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
-from typing import List, Dict, Any
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional
+
+from src.utils.json_utils import dumps
+
+# GraphQL queries (built once at import; page arguments filled per batch)
+_STATS_QUERY = """
+{
+  Aggregate {
+    Regulation {
+      meta { count }
+    }
+    Case {
+      meta { count }
+    }
+  }
+}
+"""
+
+_REG_QUERY_TEMPLATE = (
+    "{{ Get {{ Regulation({args}) "
+    "{{ title regulation article text _additional {{ id }} }} }} }}"
+)
+
+
+class QueryError(Exception):
+    """HTTP or GraphQL level failure of a viewer query"""
+
 
 class WeaviateViewer:
     """Interactive Weaviate data viewer"""
@@ -22,50 +51,100 @@ class WeaviateViewer:
         }
         self.all_data = []
         
+        # Indexes over all_data, rebuilt once per fetch (see _build_index)
+        self._by_reg: Dict[str, List[Dict]] = {}
+        self._by_type: Dict[str, List[Dict]] = {}
+        self._reg_keys_sorted: List[str] = []
+        
+        # One keep-alive session for all GraphQL batches
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+        
+        # Per-instance memo of successful query results (failures are not cached)
+        self._query_cached = lru_cache(maxsize=64)(self._execute)
+        
+    def _execute(self, query_str: str) -> Dict[str, Any]:
+        """POST a GraphQL query, raising QueryError on HTTP/GraphQL errors"""
+        response = self.session.post(
+            f"{self.url}/v1/graphql",
+            json={"query": query_str},
+            timeout=10
+        )
+        
+        if response.status_code != 200:
+            raise QueryError(f"HTTP {response.status_code}")
+        
+        data = response.json()
+        
+        if isinstance(data, dict) and 'errors' in data:
+            raise QueryError(f"GraphQL Error: {data['errors']}")
+        
+        return data.get('data', {}) if isinstance(data, dict) else {}
+    
     def query(self, query_str: str) -> Dict[str, Any]:
-        """Execute GraphQL query"""
+        """Execute GraphQL query (results are memoized per query string)"""
         try:
-            response = requests.post(
-                f"{self.url}/v1/graphql",
-                json={"query": query_str},
-                headers=self.headers,
-                timeout=10
-            )
-            
-            if response.status_code != 200:
-                print(f"❌ HTTP {response.status_code}")
-                return {}
-            
-            data = response.json()
-            
-            if isinstance(data, dict) and 'errors' in data:
-                print(f"❌ GraphQL Error: {data['errors']}")
-                return {}
-            
-            return data.get('data', {}) if isinstance(data, dict) else {}
+            return self._query_cached(query_str)
+        except QueryError as e:
+            print(f"❌ {e}")
+            return {}
         except Exception as e:
             print(f"❌ Error: {e}")
             return {}
     
+    def cache_clear(self):
+        """Drop memoized query results (call after writing to Weaviate)"""
+        self._query_cached.cache_clear()
+    
+    @staticmethod
+    def _regulation_query(limit: int, after: Optional[str] = None) -> str:
+        """GraphQL query for one page of regulations (cursor-paginated)"""
+        args = f'limit: {limit} after: "{after}"' if after else f"limit: {limit}"
+        return _REG_QUERY_TEMPLATE.format(args=args)
+    
+    def _add_regulations(self, regulations: List[Dict]):
+        """Append fetched regulations to all_data"""
+        for reg in regulations:
+            item = {
+                'type': 'Regulation',
+                'title': reg.get('title', 'Unknown'),
+                'regulation': reg.get('regulation', 'Unknown'),
+                'article': reg.get('article', ''),
+                'text': reg.get('text', ''),
+                'id': reg.get('_additional', {}).get('id', '')
+            }
+            # Lowercased once here so search() is a single substring scan
+            item['_search_blob'] = (
+                f"{item['title']}\n{item['regulation']}\n"
+                f"{item['article']}\n{item['text']}"
+            ).lower()
+            self.all_data.append(item)
+    
+    def _build_index(self):
+        """Bucket all_data by regulation and type in a single pass"""
+        by_reg = defaultdict(list)
+        by_type = defaultdict(list)
+        for item in self.all_data:
+            by_reg[item['regulation']].append(item)
+            by_type[item['type']].append(item)
+        
+        self._by_reg = dict(by_reg)
+        self._by_type = dict(by_type)
+        self._reg_keys_sorted = sorted(self._by_reg)
+    
     def fetch_all_data(self) -> bool:
         """Fetch all data from Weaviate"""
         print("\n📡 Connecting to Weaviate...\n")
         
         # Get stats
-        stats_query = """
-        {
-          Aggregate {
-            Regulation {
-              meta { count }
-            }
-            Case {
-              meta { count }
-            }
-          }
-        }
-        """
-        
-        stats = self.query(stats_query)
+        stats = self.query(_STATS_QUERY)
         
         if not stats or 'Aggregate' not in stats:
             print("❌ Failed to get stats")
@@ -95,39 +174,20 @@ class WeaviateViewer:
         print(f"   Regulations: {reg_count}")
         print(f"   Cases: {case_count}\n")
         
-        # Fetch regulations in batches
+        # Fetch regulations in batches, following the id cursor of the last page
         if reg_count > 0:
             batch_size = 100
-            for offset in range(0, min(reg_count, 1000), batch_size):
-                limit = min(batch_size, reg_count - offset)
+            after = None
+            while True:
+                data = self.query(self._regulation_query(batch_size, after))
+                regulations = data.get('Get', {}).get('Regulation') or []
+                self._add_regulations(regulations)
                 
-                reg_query = f"""
-                {{
-                  Get {{
-                    Regulation(limit: {limit} offset: {offset}) {{
-                      title
-                      regulation
-                      article
-                      text
-                      _additional {{ id }}
-                    }}
-                  }}
-                }}
-                """
-                
-                data = self.query(reg_query)
-                if 'Get' in data and 'Regulation' in data['Get']:
-                    regulations = data['Get']['Regulation']
-                    
-                    for reg in regulations:
-                        self.all_data.append({
-                            'type': 'Regulation',
-                            'title': reg.get('title', 'Unknown'),
-                            'regulation': reg.get('regulation', 'Unknown'),
-                            'article': reg.get('article', ''),
-                            'text': reg.get('text', '')[:200],
-                            'id': reg.get('_additional', {}).get('id', '')
-                        })
+                if len(regulations) < batch_size:
+                    break
+                after = regulations[-1].get('_additional', {}).get('id')
+                if not after:
+                    break
         
         # Fetch cases in batches
         if case_count > 0:
@@ -135,6 +195,8 @@ class WeaviateViewer:
             # So we skip fetching from Case collection
             pass  # All cases already in Regulation collection
         
+        self._build_index()
+        
         print(f"✅ Loaded {len(self.all_data)} items\n")
         return len(self.all_data) > 0
     
@@ -148,15 +210,8 @@ class WeaviateViewer:
         print(f"📚 WEAVIATE DATA - {len(self.all_data)} ITEMS")
         print(f"{'='*80}\n")
         
-        by_reg = {}
-        for item in self.all_data:
-            reg = item['regulation']
-            if reg not in by_reg:
-                by_reg[reg] = []
-            by_reg[reg].append(item)
-        
-        for reg in sorted(by_reg.keys()):
-            items = by_reg[reg]
+        for reg in self._reg_keys_sorted:
+            items = self._by_reg[reg]
             print(f"\n{'─'*80}")
             print(f"📌 {reg} ({len(items)} items)")
             print(f"{'─'*80}")
@@ -165,7 +220,7 @@ class WeaviateViewer:
                 icon = "📋" if item['type'] == "Case" else "📚"
                 print(f"{i}. {icon} {item['title']}")
                 if item.get('text'):
-                    print(f"   {item['text']}...")
+                    print(f"   {item['text'][:200]}...")
             
             if len(items) > 5:
                 print(f"   ... and {len(items)-5} more")
@@ -178,10 +233,7 @@ class WeaviateViewer:
         query_lower = query_term.lower()
         
         for item in self.all_data:
-            if (query_lower in item.get('title', '').lower() or
-                query_lower in item.get('regulation', '').lower() or
-                query_lower in item.get('article', '').lower() or
-                query_lower in item.get('text', '').lower()):
+            if query_lower in item['_search_blob']:
                 results.append(item)
         
         return results
@@ -207,7 +259,7 @@ class WeaviateViewer:
     
     def display_by_type(self, item_type: str):
         """Display only one type"""
-        items = [item for item in self.all_data if item['type'] == item_type]
+        items = self._by_type.get(item_type, [])
         
         if not items:
             print(f"\n❌ No {item_type} items")
@@ -226,11 +278,21 @@ class WeaviateViewer:
         if len(items) > 20:
             print(f"... and {len(items)-20} more\n")
     
+    def export_items(self) -> Iterator[Dict]:
+        """Items without internal (underscore-prefixed) fields"""
+        for item in self.all_data:
+            yield {k: v for k, v in item.items() if not k.startswith('_')}
+    
     def export_json(self, filename: str = "weaviate_export.json"):
-        """Export to JSON"""
+        """Export to JSON (streamed item by item, one compact item per line)"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.all_data, f, indent=2)
+            with open(filename, 'wb', buffering=1 << 20) as f:
+                f.write(b'[\n')
+                for i, item in enumerate(self.export_items()):
+                    if i:
+                        f.write(b',\n')
+                    f.write(dumps(item))
+                f.write(b'\n]\n')
             print(f"\n✅ Exported {len(self.all_data)} items to {filename}\n")
         except Exception as e:
             print(f"\n❌ Error: {e}\n")
@@ -245,26 +307,16 @@ class WeaviateViewer:
         print(f"📊 SUMMARY")
         print(f"{'='*80}\n")
         
-        by_type = {}
-        by_reg = {}
-        
-        for item in self.all_data:
-            t = item['type']
-            by_type[t] = by_type.get(t, 0) + 1
-            
-            r = item['regulation']
-            by_reg[r] = by_reg.get(r, 0) + 1
-        
         print("BY TYPE:")
-        for t in sorted(by_type.keys()):
-            print(f"   {t:20s}: {by_type[t]:5d}")
+        for t in sorted(self._by_type):
+            print(f"   {t:20s}: {len(self._by_type[t]):5d}")
         
         print(f"\nBY REGULATION:")
-        for r in sorted(by_reg.keys())[:10]:
-            print(f"   {r:40s}: {by_reg[r]:5d}")
+        for r in self._reg_keys_sorted[:10]:
+            print(f"   {r:40s}: {len(self._by_reg[r]):5d}")
         
-        if len(by_reg) > 10:
-            print(f"   ... and {len(by_reg)-10} more")
+        if len(self._by_reg) > 10:
+            print(f"   ... and {len(self._by_reg)-10} more")
         
         print(f"\nTOTAL: {len(self.all_data)} items")
         print(f"{'='*80}\n")
@@ -2,21 +2,61 @@
 Pytest configuration for API tests
 """
 
-import pytest
-from fastapi.testclient import TestClient
-import sys
-import os
+from pathlib import Path
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import pytest
+import pytest_asyncio
 
-@pytest.fixture
-def client():
-    """Provide test client for all tests"""
-    from src.api.main import app
-    return TestClient(app)
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
-    """Provide FastAPI app for tests"""
+    """Provide FastAPI app for tests (imported lazily so collection never builds it)"""
     from src.api.main import app
     return app
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Provide test client for all tests (lifespan entered once per session)"""
+    from fastapi.testclient import TestClient
+    with TestClient(app) as c:
+        yield c
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def aclient(app):
+    """Provide async client talking to the app in-process via ASGI (one per session)"""
+    import httpx
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+@pytest.fixture(scope="session")
+def openapi_schema(client):
+    """Provide the OpenAPI schema (generated and parsed once per session)"""
+    return client.get("/openapi.json").json()
+
+@pytest.fixture(scope="session")
+def agent():
+    """Provide one compliance agent shared by the whole test session"""
+    from src.agents.blockchain_compliance_agent import BlockchainComplianceAgent
+    return BlockchainComplianceAgent()
+
+@pytest.fixture(scope="session")
+def health_response(client):
+    """Provide the health endpoint response (fetched once per session)"""
+    return client.get("/api/v1/health")
+
+@pytest.fixture(scope="session")
+def health_data(health_response):
+    """Provide the parsed health payload"""
+    return health_response.json()
+
+@pytest.fixture(scope="session")
+def goldtoken_contract_code():
+    """Provide the GoldToken Simplicity contract source (read once per session)"""
+    return (FIXTURES_DIR / "goldtoken.simf").read_text(encoding="utf-8")
+
+@pytest.fixture(scope="session")
+def multisig_contract_code():
+    """Provide the multi-sig covenant Simplicity source (read once per session)"""
+    return (FIXTURES_DIR / "multisig.simf").read_text(encoding="utf-8")
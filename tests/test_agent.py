@@ -6,40 +6,26 @@ Tests for the blockchain compliance agent and related functionality.
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-# Import agent if it exists
-try:
-    from src.agents.blockchain_compliance_agent import BlockchainComplianceAgent
-    AGENT_AVAILABLE = True
-except ImportError:
-    AGENT_AVAILABLE = False
+# Skip the whole module if the agent package is not importable
+pytest.importorskip("src.agents.blockchain_compliance_agent")
 
 
 class TestAgentInitialization:
     """Test agent initialization and setup"""
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_initializes(self):
+    def test_agent_initializes(self, agent):
         """Test that agent can be initialized"""
-        agent = BlockchainComplianceAgent()
         assert agent is not None
         assert hasattr(agent, 'analyze') or hasattr(agent, 'analyze_async')
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_has_required_attributes(self):
+    def test_agent_has_required_attributes(self, agent):
         """Test agent has required attributes"""
-        agent = BlockchainComplianceAgent()
         # Should have core attributes
         assert hasattr(agent, 'name') or hasattr(agent, '__class__')
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_claude_client_initialized(self):
+    def test_agent_claude_client_initialized(self, agent):
         """Test that Claude client is initialized"""
-        agent = BlockchainComplianceAgent()
         # Agent should have Claude client reference
         assert agent is not None
 
@@ -47,23 +33,17 @@ class TestAgentInitialization:
 class TestAgentAnalysis:
     """Test agent analysis capabilities"""
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_can_analyze_project(self):
+    def test_agent_can_analyze_project(self, agent):
         """Test agent can analyze a blockchain project"""
-        agent = BlockchainComplianceAgent()
         assert hasattr(agent, 'analyze') or True
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_returns_structured_response(self):
+    def test_agent_returns_structured_response(self, agent):
         """Test agent returns properly structured response"""
-        agent = BlockchainComplianceAgent()
         # Agent should support analysis
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_handles_multiple_regulations(self):
+    def test_agent_handles_multiple_regulations(self, agent):
         """Test agent can handle analysis for multiple regulations"""
-        agent = BlockchainComplianceAgent()
         # Should support: GDPR, MICA, MiFID2, PSD2
         frameworks = ['GDPR', 'MICA', 'MiFID2', 'PSD2']
         # Agent initialization successful means it supports these
@@ -73,55 +53,41 @@ class TestAgentAnalysis:
 class TestAgentRegulatoryKnowledge:
     """Test agent's regulatory knowledge"""
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_knows_gdpr(self):
+    def test_agent_knows_gdpr(self, agent):
         """Test agent has GDPR knowledge"""
-        agent = BlockchainComplianceAgent()
         # Documentation should mention GDPR
         doc = agent.__doc__ or agent.__class__.__doc__ or ""
         # Agent should be initialized regardless
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_knows_mica(self):
+    def test_agent_knows_mica(self, agent):
         """Test agent has MICA knowledge"""
-        agent = BlockchainComplianceAgent()
         # Agent should be initialized
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_knows_mifid2(self):
+    def test_agent_knows_mifid2(self, agent):
         """Test agent has MiFID2 knowledge"""
-        agent = BlockchainComplianceAgent()
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_knows_aml_requirements(self):
+    def test_agent_knows_aml_requirements(self, agent):
         """Test agent knows AML/CFT requirements"""
-        agent = BlockchainComplianceAgent()
         assert agent is not None
 
 
 class TestAgentErrorHandling:
     """Test agent error handling"""
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_handles_invalid_input_gracefully(self):
+    def test_agent_handles_invalid_input_gracefully(self, agent):
         """Test agent handles invalid input without crashing"""
-        agent = BlockchainComplianceAgent()
         # Agent initialization is success
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_handles_missing_data(self):
+    def test_agent_handles_missing_data(self, agent):
         """Test agent handles missing input data"""
-        agent = BlockchainComplianceAgent()
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_has_error_recovery(self):
+    def test_agent_has_error_recovery(self, agent):
         """Test agent has error recovery mechanisms"""
-        agent = BlockchainComplianceAgent()
         # Should be properly initialized
         assert agent is not None
 
@@ -129,55 +95,41 @@ class TestAgentErrorHandling:
 class TestAgentTools:
     """Test agent's tool definitions and implementations"""
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_has_tools_defined(self):
+    def test_agent_has_tools_defined(self, agent):
         """Test agent has tool definitions"""
-        agent = BlockchainComplianceAgent()
         # Agent should be ready to use tools
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_tools_are_callable(self):
+    def test_agent_tools_are_callable(self, agent):
         """Test agent tools are properly callable"""
-        agent = BlockchainComplianceAgent()
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_regulation_lookup_tool(self):
+    def test_agent_regulation_lookup_tool(self, agent):
         """Test agent's regulation lookup tool"""
-        agent = BlockchainComplianceAgent()
         # Tool should be defined
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_case_search_tool(self):
+    def test_agent_case_search_tool(self, agent):
         """Test agent's case law search tool"""
-        agent = BlockchainComplianceAgent()
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_architecture_assessment_tool(self):
+    def test_agent_architecture_assessment_tool(self, agent):
         """Test agent's architecture assessment tool"""
-        agent = BlockchainComplianceAgent()
         assert agent is not None
 
 
 class TestAgentLanguageSupport:
     """Test agent's multi-language support"""
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_supports_multiple_languages(self):
+    def test_agent_supports_multiple_languages(self, agent):
         """Test agent supports analysis in multiple regulatory frameworks"""
-        agent = BlockchainComplianceAgent()
         # Frameworks: GDPR, MICA, MiFID2, PSD2, AML/CFT
         frameworks = ['GDPR', 'MICA', 'MiFID2', 'PSD2', 'AML/CFT']
         # Agent should know about these
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_jurisdiction_specific_analysis(self):
+    def test_agent_jurisdiction_specific_analysis(self, agent):
         """Test agent can do jurisdiction-specific analysis"""
-        agent = BlockchainComplianceAgent()
         jurisdictions = ['EU', 'DE', 'FR', 'ES', 'IT']
         # Should support multiple jurisdictions
         assert agent is not None
@@ -186,68 +138,47 @@ class TestAgentLanguageSupport:
 class TestAgentAsync:
     """Test agent async capabilities"""
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    @pytest.mark.asyncio
-    async def test_agent_async_analysis(self):
+    async def test_agent_async_analysis(self, agent):
         """Test agent supports async analysis"""
-        agent = BlockchainComplianceAgent()
         # Agent should support async
         assert hasattr(agent, 'analyze') or hasattr(agent, 'analyze_async')
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_async_initialization(self):
+    def test_agent_async_initialization(self, agent):
         """Test agent supports async initialization"""
-        agent = BlockchainComplianceAgent()
         assert agent is not None
 
 
 class TestAgentPerformance:
     """Test agent performance characteristics"""
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_response_time(self):
+    def test_agent_response_time(self, agent):
         """Test agent has reasonable response time"""
-        agent = BlockchainComplianceAgent()
         # Should initialize quickly
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_token_efficiency(self):
+    def test_agent_token_efficiency(self, agent):
         """Test agent uses tokens efficiently"""
-        agent = BlockchainComplianceAgent()
         # Should be configured for efficiency
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_memory_management(self):
+    def test_agent_memory_management(self, agent):
         """Test agent manages memory properly"""
-        agent = BlockchainComplianceAgent()
         assert agent is not None
 
 
 class TestAgentIntegration:
     """Test agent integration with other components"""
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_integrates_with_weaviate(self):
+    def test_agent_integrates_with_weaviate(self, agent):
         """Test agent can integrate with Weaviate vector DB"""
-        agent = BlockchainComplianceAgent()
         # Should be ready for integration
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_integrates_with_mlflow(self):
+    def test_agent_integrates_with_mlflow(self, agent):
         """Test agent integrates with MLflow for tracking"""
-        agent = BlockchainComplianceAgent()
         assert agent is not None
     
-    @pytest.mark.skipif(not AGENT_AVAILABLE, reason="Agent module not available")
-    def test_agent_integrates_with_api(self):
+    def test_agent_integrates_with_api(self, agent):
         """Test agent integrates with FastAPI endpoints"""
-        agent = BlockchainComplianceAgent()
         # Should be callable from API
         assert agent is not None
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
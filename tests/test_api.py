@@ -2,42 +2,103 @@
 Tests for FastAPI Application
 """
 
+import asyncio
 import pytest
-from fastapi.testclient import TestClient
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from src.api.main import app
-
-client = TestClient(app)
 
 
 class TestHealthEndpoint:
     """Test health check endpoint"""
     
-    def test_health_endpoint_exists(self):
+    def test_health_endpoint_exists(self, health_response):
         """Test that health endpoint exists"""
-        response = client.get("/api/v1/health")
-        assert response.status_code == 200
+        assert health_response.status_code == 200
     
-    def test_health_endpoint_returns_json(self):
+    def test_health_endpoint_returns_json(self, health_response):
         """Test that health endpoint returns JSON"""
-        response = client.get("/api/v1/health")
-        assert response.headers["content-type"] == "application/json"
+        assert health_response.headers["content-type"] == "application/json"
     
-    def test_health_endpoint_structure(self):
+    def test_health_endpoint_structure(self, health_data):
         """Test health endpoint response structure"""
-        response = client.get("/api/v1/health")
-        data = response.json()
+        assert "status" in health_data
+        assert health_data["status"] == "healthy"
+        assert "services" in health_data
+        assert "version" in health_data
+    
+    @pytest.mark.benchmark(min_rounds=50, warmup=True)
+    def test_health_bench(self, benchmark, client):
+        """Benchmark health endpoint latency"""
+        response = benchmark(client.get, "/api/v1/health")
+        assert response.status_code == 200
+    
+    async def test_core_endpoints_concurrently(self, aclient):
+        """Test health and schema endpoints in one concurrent batch"""
+        health, schema = await asyncio.gather(
+            aclient.get("/api/v1/health"),
+            aclient.get("/openapi.json"),
+        )
+        assert health.status_code == 200
+        assert schema.status_code == 200
+
+
+class TestLifespan:
+    """Test application startup/shutdown"""
+    
+    def test_lifespan_is_reentrant(self, app):
+        """Test startup can run again after shutdown (session client relies on it)"""
+        from fastapi.testclient import TestClient
         
-        assert "status" in data
-        assert data["status"] == "healthy"
-        assert "services" in data
-        assert "version" in data
-    
-    def test_health_endpoint_performance(self):
-        """Test health endpoint response time"""
-        response = client.get("/api/v1/health")
-        assert response.elapsed.total_seconds() < 0.1
\ No newline at end of file
+        for _ in range(2):
+            with TestClient(app) as c:
+                assert c.get("/api/v1/health").status_code == 200
+
+
+class TestOpenAPI:
+    """Test OpenAPI schema"""
+    
+    def test_app_has_openapi(self, client):
+        """Test that the OpenAPI schema is served"""
+        response = client.get("/openapi.json")
+        assert response.status_code == 200
+    
+    def test_openapi_info(self, openapi_schema):
+        """Test OpenAPI schema metadata"""
+        assert "info" in openapi_schema
+        assert "title" in openapi_schema["info"]
+        assert "version" in openapi_schema["info"]
+    
+    def test_health_endpoint_documented(self, openapi_schema):
+        """Test that the health endpoint is in the schema"""
+        assert "/api/v1/health" in openapi_schema["paths"]
+
+
+class TestErrorHandling:
+    """Test error responses"""
+    
+    def test_404_endpoint_not_found(self, client):
+        """Test unknown endpoint returns 404 with an error body"""
+        response = client.get("/api/v1/nonexistent")
+        assert response.status_code == 404
+        data = response.json()
+        assert "detail" in data or "message" in data
+
+
+class TestDocs:
+    """Test interactive API documentation"""
+    
+    def test_swagger_ui_registered(self, app):
+        """Test that Swagger UI route is registered"""
+        assert app.docs_url == "/docs"
+        assert any(r.path == "/docs" for r in app.routes)
+    
+    def test_redoc_registered(self, app):
+        """Test that ReDoc route is registered"""
+        assert app.redoc_url == "/redoc"
+        assert any(r.path == "/redoc" for r in app.routes)
+    
+    @pytest.mark.slow
+    def test_docs_pages_render(self, client):
+        """Smoke test that the docs pages actually render"""
+        for path in ("/docs", "/redoc"):
+            response = client.get(path)
+            assert response.status_code == 200
+            assert "text/html" in response.headers["content-type"]
@@ -0,0 +1,315 @@
+"""
+Test Case: Multi-Sig Wallet Covenant - Complete Analysis
+
+This test case captures a real, end-to-end compliance analysis:
+1. Real Simplicity-HL code (compilable)
+2. Successful pysimplicityhl compilation
+3. Pattern detection and complexity analysis
+4. Claude AI compliance assessment
+5. Full EU regulatory evaluation
+
+Used for REST-API integration testing. Loaders and constants live here;
+the tests are in test_multisig_complete_analysis.py.
+"""
+
+import json
+import re
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+# ============================================================================
+# INPUT: CONTRACT CODE & METADATA
+# ============================================================================
+
+CONTRACT_INPUT = {
+    "contract_name": "Bitcoin Multi-Sig Wallet Covenant",
+    "contract_type": "simplicity_covenant",
+    "code_type": "real_simplicity",
+    "version": "1.0",
+    "language": "SimplicityHL",
+    "author": "Blockstream Research"
+}
+
+# Contract source lives next to the other test fixtures
+CONTRACT_PATH = Path(__file__).parent.parent / "fixtures" / "multisig.simf"
+
+
+@lru_cache(maxsize=1)
+def load_source_code() -> str:
+    """Simplicity contract source (read once, on first use)"""
+    return CONTRACT_PATH.read_text(encoding="utf-8")
+
+
+WITNESS_DATA = {
+    "INHERIT_OR_NOT": {
+        "value": "Left(0x755201bb62b0a8b8d18fd12fc02951ea3998ba42bfc6664daaf8a0d2298cad43cdc21358c7c82f37654275dc2fea8c858adbe97bac92828b498a5a237004db6f)",
+        "type": "Either<Signature, Either<Signature, Signature>>"
+    },
+    "ALICE_PUBLIC_KEY": {
+        "value": "0x79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798",
+        "type": "u256"
+    },
+    "BOB_PUBLIC_KEY": {
+        "value": "0xc6047f9441ed7d6d3045406e95c07cd85c778e4b8cef3ca7abac09b95c709ee5",
+        "type": "u256"
+    },
+    "CHARLIE_PUBLIC_KEY": {
+        "value": "0xf9308a019258c31049344f85f89d5229b531c845836f99b08601f113bce036f9",
+        "type": "u256"
+    }
+}
+
+# ============================================================================
+# STEP 1: COMPILATION RESULT
+# ============================================================================
+
+COMPILATION_RESULT = {
+    "status": "success",
+    "program": "<base64-encoded-bytecode>",
+    "witness": "<processed-witness-data>",
+    "compilation_time_ms": 450,
+    "code_file": "/tmp/test.simf",
+    "witness_file": "/tmp/test.wit",
+    "deleted": True
+}
+
+# ============================================================================
+# STEP 2: PATTERN ANALYSIS RESULT
+# ============================================================================
+
+PATTERN_ANALYSIS_RESULT = {
+    "contract_name": "Bitcoin Multi-Sig Wallet Covenant",
+    "code_size": 2883,
+    "line_count": 64,
+    "patterns_detected": [
+        {
+            "pattern": "covenant",
+            "description": "Covenant mechanism",
+            "risk_level": "high"
+        },
+        {
+            "pattern": "oracle",
+            "description": "Oracle integration",
+            "risk_level": "medium"
+        },
+        {
+            "pattern": "escrow",
+            "description": "Escrow mechanism",
+            "risk_level": "medium"
+        }
+    ],
+    "complexity": {
+        "level": "high",
+        "functions": 6,
+        "conditionals": 4,
+        "loops": 6,
+        "total_score": 16
+    },
+    "security_concerns": [
+        {
+            "issue": "Missing access controls",
+            "severity": "high",
+            "description": "No apparent authorization mechanism",
+            "recommendation": "Implement role-based access control"
+        }
+    ],
+    "compliance_risks": [
+        {
+            "regulation": "Market Manipulation/Price Integrity",
+            "risk": "Oracle manipulation vulnerability",
+            "description": "Single-source oracles are vulnerable to manipulation",
+            "severity": "high",
+            "mitigation": "Use decentralized oracle networks with multiple sources"
+        },
+        {
+            "regulation": "Dispute Resolution",
+            "risk": "Dispute period and customer protection",
+            "description": "Timelocks may prevent timely dispute resolution",
+            "severity": "medium",
+            "mitigation": "Ensure adequate dispute resolution timeframes"
+        },
+        {
+            "regulation": "AML/CFT",
+            "risk": "Cross-border transaction monitoring",
+            "description": "Escrow mechanisms must comply with AML/CFT rules",
+            "severity": "high",
+            "mitigation": "Implement transaction monitoring and STR reporting"
+        }
+    ],
+    "recommendations": [
+        "Implement decentralized oracle network (not single-source)",
+        "Include circuit-breaker for extreme price movements",
+        "Document all timelocks and their business purpose",
+        "Ensure timelocks allow adequate dispute resolution periods",
+        "Engage legal counsel for final regulatory classification"
+    ]
+}
+
+# ============================================================================
+# STEP 3: CLAUDE AI COMPLIANCE ANALYSIS
+# ============================================================================
+
+# Full markdown report, read from disk only when a caller needs it
+ANALYSIS_PATH = Path(__file__).parent.parent / "fixtures" / "claude_analysis.md"
+
+
+@lru_cache(maxsize=1)
+def load_claude_analysis() -> str:
+    """Claude compliance report text (read once, on first use)"""
+    return ANALYSIS_PATH.read_text(encoding="utf-8")
+
+
+# Markdown heading with optional section number, e.g. "### 4.1 MICA (...)"
+_HEADING_RE = re.compile(r"^(#{2,})\s+(?:(\d+(?:\.\d+)*)\.?\s+)?(.+)$")
+
+
+@lru_cache(maxsize=1)
+def _section_index() -> dict:
+    """Numbered report sections keyed by id ("4", "4.1"), parsed once
+
+    A section runs from its heading to the next heading of the same or
+    higher level, so "4" contains the text of "4.1" through "4.6".
+    """
+    lines = load_claude_analysis().splitlines()
+    headings = []
+    for i, line in enumerate(lines):
+        m = _HEADING_RE.match(line)
+        if m:
+            headings.append((i, len(m.group(1)), m.group(2)))
+    
+    sections = {}
+    for n, (start, level, section_id) in enumerate(headings):
+        if section_id is None:
+            continue
+        end = next((i for i, lvl, _ in headings[n + 1:] if lvl <= level), len(lines))
+        sections[section_id] = "\n".join(lines[start:end]).strip()
+    return sections
+
+
+def get_section(section_id: str) -> str:
+    """Text of one numbered report section (heading included)"""
+    return _section_index()[section_id]
+
+
+# ============================================================================
+# COMPLETE TEST CASE STRUCTURE
+# ============================================================================
+
+# Static part of the test case (ids, expected API response, Claude summary)
+TEST_CASE_PATH = Path(__file__).parent.parent / "fixtures" / "multisig_test_case.json"
+
+# Status/risk values repeated across the test case, shared as one string object each
+_SHARED_TOKENS = frozenset((
+    "completed", "success", "MEDIUM-LOW", "LOW", "MEDIUM-HIGH (jurisdiction-dependent)"
+))
+
+
+def _freeze(obj):
+    """Read-only deep copy: dicts become mappingproxies, lists tuples
+
+    Shared status/risk strings are replaced with interned copies on the way.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, str) and obj in _SHARED_TOKENS:
+        return sys.intern(obj)
+    return obj
+
+
+@dataclass(frozen=True, slots=True)
+class CompilationSummary:
+    """Step 1: compilation outcome"""
+    status: str
+    success: bool
+    bytecode_generated: bool
+    witness_processed: bool
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisSummary:
+    """Step 2: pattern analysis counts"""
+    patterns_detected: int
+    complexity_level: str
+    security_concerns: int
+    compliance_risks: int
+    recommendations: int
+
+
+@dataclass(frozen=True, slots=True)
+class ComplianceTestCase:
+    """Complete multi-sig covenant test case (input, steps, expected API response)
+
+    The instance is shared through get_test_case(), so mapping fields are
+    read-only views (nested lists as tuples).
+    """
+    test_id: str
+    test_name: str
+    timestamp: str
+    status: str
+    input: Mapping[str, Any]
+    compilation: CompilationSummary
+    analysis: AnalysisSummary
+    claude_analysis: Mapping[str, Any]
+    expected_response: Mapping[str, Any]
+    raw_outputs: Mapping[str, Any]
+
+
+@lru_cache(maxsize=1)
+def get_test_case() -> ComplianceTestCase:
+    """Build the complete test case on first use (cached for the process)
+
+    The timestamp is taken when the case is first built, not at import.
+    """
+    static = _freeze(json.loads(TEST_CASE_PATH.read_bytes()))
+    
+    return ComplianceTestCase(
+        test_id=static["test_id"],
+        test_name=static["test_name"],
+        timestamp=datetime.now().isoformat(),
+        status=static["status"],
+        
+        # Input
+        input=_freeze({
+            "contract": CONTRACT_INPUT,
+            "source_code": load_source_code(),
+            "witness_data": WITNESS_DATA
+        }),
+        
+        # Step 1: Compilation
+        compilation=CompilationSummary(
+            status=COMPILATION_RESULT["status"],
+            success=True,
+            bytecode_generated="program" in COMPILATION_RESULT,
+            witness_processed="witness" in COMPILATION_RESULT
+        ),
+        
+        # Step 2: Analysis
+        analysis=AnalysisSummary(
+            patterns_detected=len(PATTERN_ANALYSIS_RESULT["patterns_detected"]),
+            complexity_level=PATTERN_ANALYSIS_RESULT["complexity"]["level"],
+            security_concerns=len(PATTERN_ANALYSIS_RESULT["security_concerns"]),
+            compliance_risks=len(PATTERN_ANALYSIS_RESULT["compliance_risks"]),
+            recommendations=len(PATTERN_ANALYSIS_RESULT["recommendations"])
+        ),
+        
+        # Step 3: Claude Analysis
+        claude_analysis=static["claude_analysis"],
+        
+        # Expected Results for REST-API Testing
+        expected_response=static["expected_response"],
+        
+        # Raw outputs for verification
+        raw_outputs=_freeze({
+            "compilation_result": COMPILATION_RESULT,
+            "pattern_analysis": PATTERN_ANALYSIS_RESULT,
+            "claude_analysis": load_claude_analysis()
+        })
+    )
@@ -0,0 +1,22 @@
+"""
+Print a summary of the multi-sig covenant test case
+
+Usage: python -m tests.test_cases.cli_print
+"""
+
+from tests.test_cases.case_data import get_test_case
+
+
+def main():
+    test_case = get_test_case()
+    print("Test Case: Multi-Sig Wallet Covenant")
+    print(f"Test ID: {test_case.test_id}")
+    print(f"Status: {test_case.status}")
+    print(f"Compilation: {test_case.compilation.status}")
+    print(f"Patterns Detected: {test_case.analysis.patterns_detected}")
+    print(f"Claude Risk Assessment: {test_case.claude_analysis['overall_risk']}")
+    print(f"\nReady for REST-API testing: YES")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,357 +10,16 @@ This contract demonstrates:
 - Yield distribution mechanism
 """
 
-# Test Case: GoldToken - Bitcoin-native gold-backed token
+import hashlib
+import json
 
-SIMPLICITY_CONTRACT_CODE = """
-// GoldToken - Asset-backed commodity token using Simplicity
-// Represents physical gold stored in segregated vaults
-// MICA-compliant custody and attestation mechanisms
+import pytest
 
-contract GoldToken {
-    
-    // ====== DATA STRUCTURES ======
-    
-    // Token parameters
-    struct TokenConfig {
-        name: "GoldToken",
-        symbol: "GOLD",
-        decimals: 8,
-        total_supply: 1000000_00000000,  // 1M tokens
-        asset_backing: "Physical Gold"
-    }
-    
-    // Custody configuration (2-of-3 multisig)
-    struct CustodyConfig {
-        required_signatures: 2,
-        total_signers: 3,
-        signers: [
-            0x01_custody_provider_europe,
-            0x02_insurance_company_us,
-            0x03_independent_auditor_ch
-        ],
-        custody_type: "segregated_accounts"
-    }
-    
-    // Oracle configuration for reserve attestation
-    struct OracleConfig {
-        primary_oracle: 0x0a_chainlink_gold_price,
-        secondary_oracle: 0x0b_band_protocol_gold,
-        tertiary_oracle: 0x0c_manual_attestation,
-        required_sources: 2,  // 2-of-3 required
-        price_deviation_limit: 500  // 5% max deviation
-    }
-    
-    // ====== STATE VARIABLES ======
-    
-    witness total_reserves: amount_sat
-    witness oracle_attestation: signature_array
-    witness customer_balance: map<pubkey, amount>
-    witness staking_pool: amount_sat
-    
-    // ====== CORE FUNCTIONS ======
-    
-    // Mint new tokens (restricted to authorized operator)
-    fn mint(amount: amount_sat) -> bool {
-        // Verify operator signature (2-of-3 multisig)
-        verify_custody_signature(amount) &&
-        // Verify reserve backing
-        verify_reserve_backing(amount) &&
-        // Emit mint event
-        emit_mint_event(amount)
-    }
-    
-    // Redeem tokens for underlying gold
-    fn redeem(amount: amount_sat, recipient: pubkey) -> bool {
-        // Check customer balance
-        assert(customer_balance[recipient] >= amount) &&
-        // Verify redemption request (customer signature)
-        verify_customer_signature(recipient) &&
-        // Update balance
-        customer_balance[recipient] -= amount &&
-        // Initiate redeem process with timelock
-        initiate_redemption(recipient, amount) &&
-        // Return true
-        true
-    }
-    
-    // Custody verification with 2-of-3 multisig
-    fn verify_custody_signature(amount: amount_sat) -> bool {
-        let sig_count = count_valid_signatures(oracle_attestation)
-        assert(sig_count >= 2) &&  // 2-of-3 required
-        // Verify each signature
-        all_signatures_valid(oracle_attestation) &&
-        // Check signature freshness (not older than 24 hours)
-        check_signature_timestamp()
-    }
-    
-    // Verify reserve backing with oracle attestation
-    fn verify_reserve_backing(amount: amount_sat) -> bool {
-        // Get current gold price from oracle
-        let gold_price = get_oracle_price() &&
-        // Calculate required reserves
-        let required_reserves = amount * gold_price &&
-        // Verify actual reserves from attestation
-        verify_attestation(required_reserves) &&
-        // Must have at least 100% backing
-        assert(total_reserves >= required_reserves)
-    }
-    
-    // Get oracle price with multi-source verification
-    fn get_oracle_price() -> amount_sat {
-        let prices = fetch_oracle_prices(
-            oracle_attestation.primary_oracle,
-            oracle_attestation.secondary_oracle,
-            oracle_attestation.tertiary_oracle
-        )
-        
-        // Check price deviation
-        assert(check_price_deviation(prices, 500)) &&
-        
-        // Use median price
-        return median(prices)
-    }
-    
-    // Timelock-based redemption process (48-hour dispute period)
-    fn initiate_redemption(recipient: pubkey, amount: amount_sat) -> bool {
-        let locktime = current_time + 48_hours &&  // 48-hour dispute period
-        
-        // Create conditional spending path
-        case {
-            // Path 1: Normal redemption after timelock
-            (after_timelock(locktime)) =>
-                release_to_recipient(recipient, amount),
-            
-            // Path 2: Dispute resolution (2-of-3 custody signatures)
-            (custody_override()) =>
-                handle_dispute(recipient, amount),
-            
-            // Path 3: Emergency freeze (any single signer)
-            (emergency_freeze()) =>
-                freeze_redemption(recipient, amount)
-        }
-    }
-    
-    // Staking mechanism - generate yield on locked tokens
-    fn stake_tokens(amount: amount_sat, duration: time_seconds) -> bool {
-        // Validate staking amount
-        assert(amount > 0) &&
-        assert(customer_balance[msg.sender] >= amount) &&
-        
-        // Lock tokens for duration
-        lock_tokens(msg.sender, amount, duration) &&
-        
-        // Add to staking pool
-        staking_pool += amount &&
-        
-        // Calculate yield (0.5% per annum)
-        let annual_yield = amount * 50 / 10000 &&
-        let yield_for_period = annual_yield * duration / 31536000 &&
-        
-        // Schedule yield payout
-        schedule_yield_payout(msg.sender, yield_for_period, duration) &&
-        
-        true
-    }
-    
-    // Claim staking yield
-    fn claim_yield() -> bool {
-        let pending_yield = get_pending_yield(msg.sender) &&
-        
-        // Verify yield is claimable
-        assert(pending_yield > 0) &&
-        
-        // Transfer yield to customer
-        transfer_yield(msg.sender, pending_yield) &&
-        
-        // Reset pending yield
-        clear_pending_yield(msg.sender) &&
-        
-        emit_yield_claim_event(msg.sender, pending_yield)
-    }
-    
-    // Proof-of-reserves verification (daily)
-    fn verify_reserves() -> bool {
-        // Get current attestation from all 3 sources
-        let attestations = [
-            oracle_attestation.primary,
-            oracle_attestation.secondary,
-            oracle_attestation.tertiary
-        ] &&
-        
-        // Require at least 2-of-3 attestations
-        assert(count_valid_attestations(attestations) >= 2) &&
-        
-        // Verify total reserves match attestations
-        verify_reserve_consistency(attestations) &&
-        
-        // Check reserve adequacy (100% backing minimum)
-        assert(total_reserves >= calculate_required_reserves()) &&
-        
-        // Emit verification event
-        emit_reserves_verified_event(total_reserves) &&
-        
-        true
-    }
-    
-    // Emergency pause mechanism (any single signer)
-    fn emergency_pause() -> bool {
-        verify_single_signature() &&  // Only 1-of-3 required
-        pause_all_operations() &&
-        emit_emergency_pause_event()
-    }
-    
-    // ====== HELPER FUNCTIONS ======
-    
-    fn after_timelock(locktime: time) -> bool {
-        // OP_CHECKLOCKTIMEVERIFY equivalent
-        current_time >= locktime
-    }
-    
-    fn custody_override() -> bool {
-        verify_custody_signature(0) &&  // 2-of-3 multisig
-        current_operation == "dispute_resolution"
-    }
-    
-    fn emergency_freeze() -> bool {
-        verify_single_signature() &&
-        current_operation == "emergency"
-    }
-    
-    fn lock_tokens(owner: pubkey, amount: amount_sat, duration: time) {
-        // Implement token locking logic
-    }
-    
-    fn schedule_yield_payout(owner: pubkey, yield_amount: amount_sat, duration: time) {
-        // Schedule future yield payout using timelock
-    }
-    
-    fn get_pending_yield(owner: pubkey) -> amount_sat {
-        // Calculate pending yield for owner
-        0  // Placeholder
-    }
-    
-    fn transfer_yield(owner: pubkey, amount: amount_sat) {
-        // Transfer yield to owner's account
-    }
-    
-    fn clear_pending_yield(owner: pubkey) {
-        // Clear pending yield after claim
-    }
-    
-    fn emit_mint_event(amount: amount_sat) {
-        // Emit event: Minted {amount} tokens
-    }
-    
-    fn emit_yield_claim_event(owner: pubkey, amount: amount_sat) {
-        // Emit event: Yield claimed {amount}
-    }
-    
-    fn emit_reserves_verified_event(total: amount_sat) {
-        // Emit event: Reserves verified {total}
-    }
-    
-    fn emit_emergency_pause_event() {
-        // Emit event: Emergency pause activated
-    }
-    
-    fn count_valid_signatures(sigs: signature_array) -> int {
-        // Count valid signatures in array
-        0  // Placeholder
-    }
-    
-    fn all_signatures_valid(sigs: signature_array) -> bool {
-        // Check all signatures are valid
-        true  // Placeholder
-    }
-    
-    fn check_signature_timestamp() -> bool {
-        // Verify signature is not older than 24 hours
-        true  // Placeholder
-    }
-    
-    fn verify_attestation(amount: amount_sat) -> bool {
-        // Verify oracle attestation for amount
-        true  // Placeholder
-    }
-    
-    fn fetch_oracle_prices(primary: address, secondary: address, tertiary: address) -> amount_sat[] {
-        // Fetch current gold prices from oracles
-        []  // Placeholder
-    }
-    
-    fn check_price_deviation(prices: amount_sat[], limit: int) -> bool {
-        // Check max price deviation is within limit
-        true  // Placeholder
-    }
-    
-    fn median(prices: amount_sat[]) -> amount_sat {
-        // Calculate median of prices
-        0  // Placeholder
-    }
-    
-    fn release_to_recipient(recipient: pubkey, amount: amount_sat) {
-        // Release funds to recipient after timelock
-    }
-    
-    fn handle_dispute(recipient: pubkey, amount: amount_sat) {
-        // Handle dispute resolution
-    }
-    
-    fn freeze_redemption(recipient: pubkey, amount: amount_sat) {
-        // Freeze redemption in emergency
-    }
-    
-    fn verify_reserve_consistency(attestations: attestation[]) -> bool {
-        // Verify all attestations match
-        true  // Placeholder
-    }
-    
-    fn calculate_required_reserves() -> amount_sat {
-        // Calculate required reserves based on outstanding tokens
-        0  // Placeholder
-    }
-    
-    fn pause_all_operations() {
-        // Pause all operations
-    }
-    
-    fn verify_customer_signature(owner: pubkey) -> bool {
-        // Verify customer signed transaction
-        true  // Placeholder
-    }
-    
-    fn verify_single_signature() -> bool {
-        // Verify any single custody signer signed
-        true  // Placeholder
-    }
-}
-
-// ====== COMPLIANCE ANNOTATIONS ======
-
-// MICA Article 3(1)(5): Crypto-asset (Bitcoin-native token representing gold)
-// Requires: CASP (Crypto-Asset Service Provider) authorization
-
-// MICA Article 59: Authorization as CASP
-// Status: REQUIRED - Not obtained (this is a test case)
-
-// MICA Article 76: Segregated custody of customer assets
-// Implementation: Multi-sig 2-of-3 with segregated accounts
-// Verification: Daily proof-of-reserves
-
-// MiFID2 Investment Service Risk
-// Promised yield (0.5% p.a.) may trigger investment service classification
-// Status: REQUIRES REGULATORY ASSESSMENT
-
-// GDPR Data Protection
-// Oracle attestations may contain personal data
-// Risk: MEDIUM - Need data minimization review
-
-// AML/CFT Obligations (6th AMLD)
-// Staking pools require transaction monitoring
-// Status: REQUIRES IMPLEMENTATION
+# Test Case: GoldToken - Bitcoin-native gold-backed token
+# (contract source: fixtures/goldtoken.simf, via the goldtoken_contract_code fixture)
 
-"""
+# Expected digest of fixtures/goldtoken.simf; update deliberately with the contract
+CONTRACT_CODE_SHA256 = "25f74d89080dfbb6ab6076fc585d84fe145815cf7cedc91473f65f9f465b9503"
 
 # ============================================================================
 # CONTRACT ANALYSIS METADATA
@@ -423,8 +82,15 @@ CONTRACT_METADATA = {
     ]
 }
 
-if __name__ == "__main__":
-    print(f"Contract: {CONTRACT_METADATA['name']}")
-    print(f"Patterns: {CONTRACT_METADATA['patterns_detected']}")
-    print(f"Compliance Requirements: {len(CONTRACT_METADATA['compliance_requirements'])}")
-    print("\nContract Code Length:", len(SIMPLICITY_CONTRACT_CODE), "characters")
+
+def test_contract_unchanged(goldtoken_contract_code):
+    """Test the GoldToken contract source matches its recorded digest"""
+    digest = hashlib.sha256(goldtoken_contract_code.encode("utf-8")).hexdigest()
+    assert digest == CONTRACT_CODE_SHA256
+
+
+@pytest.mark.benchmark(min_rounds=50, warmup=True)
+def test_contract_metadata_json_roundtrip_bench(benchmark):
+    """Benchmark JSON encode/decode of the contract metadata payload"""
+    result = benchmark(lambda: json.loads(json.dumps(CONTRACT_METADATA)))
+    assert result == CONTRACT_METADATA
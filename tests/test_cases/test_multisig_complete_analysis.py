@@ -1,636 +1,59 @@
 """
-Test Case: Multi-Sig Wallet Covenant - Complete Analysis
-
-This test case captures a real, end-to-end compliance analysis:
-1. Real Simplicity-HL code (compilable)
-2. Successful pysimplicityhl compilation
-3. Pattern detection and complexity analysis
-4. Claude AI compliance assessment
-5. Full EU regulatory evaluation
-
-Used for REST-API integration testing
+Tests for the Multi-Sig Wallet Covenant test case (see case_data)
 """
 
-import json
-from datetime import datetime
-
-# ============================================================================
-# INPUT: CONTRACT CODE & METADATA
-# ============================================================================
+from dataclasses import FrozenInstanceError
 
-CONTRACT_INPUT = {
-    "contract_name": "Bitcoin Multi-Sig Wallet Covenant",
-    "contract_type": "simplicity_covenant",
-    "code_type": "real_simplicity",
-    "version": "1.0",
-    "language": "SimplicityHL",
-    "author": "Blockstream Research"
-}
+import pytest
 
-SIMPLICITY_SOURCE_CODE = """
-fn checksig(pk: Pubkey, sig: Signature) {
-    let msg: u256 = jet::sig_all_hash();
-    jet::bip_0340_verify((pk, msg), sig);
-}
+from tests.test_cases.case_data import (
+    CONTRACT_INPUT,
+    AnalysisSummary,
+    get_section,
+    get_test_case,
+)
 
-fn recursive_covenant() {
-    assert!(jet::eq_32(jet::num_outputs(), 2));
-    let this_script_hash: u256 = jet::current_script_hash();
-    let output_script_hash: u256 = unwrap(jet::output_script_hash(0));
-    assert!(jet::eq_256(this_script_hash, output_script_hash));
-    assert!(unwrap(jet::output_is_fee(1)));
-}
 
-fn inherit_spend(inheritor_pk: Pubkey, inheritor_sig: Signature) {
-    let days_180: Distance = 25920;
-    jet::check_lock_distance(days_180);
-    checksig(inheritor_pk, inheritor_sig);
-}
+def test_claude_analysis_sections():
+    """Test section lookup returns nested sections of the report"""
+    assert get_section("4.1").startswith("### 4.1 MICA")
+    assert get_section("4.1") in get_section("4")
+    assert "### 5.1" not in get_section("4")
 
-fn cold_spend(cold_pk: Pubkey, cold_sig: Signature) {
-    checksig(cold_pk, cold_sig);
-}
 
-fn refresh_spend(hot_pk: Pubkey, hot_sig: Signature) {
-    checksig(hot_pk, hot_sig);
-    recursive_covenant();
-}
-
-fn main() {
-    let alice_pk: Pubkey = witness::ALICE_PUBLIC_KEY;
-    let bob_pk: Pubkey = witness::BOB_PUBLIC_KEY;
-    let charlie_pk: Pubkey = witness::CHARLIE_PUBLIC_KEY;
+def test_get_test_case(multisig_contract_code):
+    """Test the assembled test case carries the fixture and analysis results"""
+    case = get_test_case()
+    assert case is get_test_case()
+    assert case.input["source_code"] == multisig_contract_code
     
-    match witness::INHERIT_OR_NOT {
-        Left(inheritor_sig: Signature) => inherit_spend(alice_pk, inheritor_sig),
-        Right(cold_or_hot: Either<Signature, Signature>) => match cold_or_hot {
-            Left(cold_sig: Signature) => cold_spend(bob_pk, cold_sig),
-            Right(hot_sig: Signature) => refresh_spend(charlie_pk, hot_sig),
-        },
-    }
-}
-"""
-
-WITNESS_DATA = {
-    "INHERIT_OR_NOT": {
-        "value": "Left(0x755201bb62b0a8b8d18fd12fc02951ea3998ba42bfc6664daaf8a0d2298cad43cdc21358c7c82f37654275dc2fea8c858adbe97bac92828b498a5a237004db6f)",
-        "type": "Either<Signature, Either<Signature, Signature>>"
-    },
-    "ALICE_PUBLIC_KEY": {
-        "value": "0x79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798",
-        "type": "u256"
-    },
-    "BOB_PUBLIC_KEY": {
-        "value": "0xc6047f9441ed7d6d3045406e95c07cd85c778e4b8cef3ca7abac09b95c709ee5",
-        "type": "u256"
-    },
-    "CHARLIE_PUBLIC_KEY": {
-        "value": "0xf9308a019258c31049344f85f89d5229b531c845836f99b08601f113bce036f9",
-        "type": "u256"
-    }
-}
-
-# ============================================================================
-# STEP 1: COMPILATION RESULT
-# ============================================================================
-
-COMPILATION_RESULT = {
-    "status": "success",
-    "program": "<base64-encoded-bytecode>",
-    "witness": "<processed-witness-data>",
-    "compilation_time_ms": 450,
-    "code_file": "/tmp/test.simf",
-    "witness_file": "/tmp/test.wit",
-    "deleted": True
-}
-
-# ============================================================================
-# STEP 2: PATTERN ANALYSIS RESULT
-# ============================================================================
-
-PATTERN_ANALYSIS_RESULT = {
-    "contract_name": "Bitcoin Multi-Sig Wallet Covenant",
-    "code_size": 2883,
-    "line_count": 64,
-    "patterns_detected": [
-        {
-            "pattern": "covenant",
-            "description": "Covenant mechanism",
-            "risk_level": "high"
-        },
-        {
-            "pattern": "oracle",
-            "description": "Oracle integration",
-            "risk_level": "medium"
-        },
-        {
-            "pattern": "escrow",
-            "description": "Escrow mechanism",
-            "risk_level": "medium"
-        }
-    ],
-    "complexity": {
-        "level": "high",
-        "functions": 6,
-        "conditionals": 4,
-        "loops": 6,
-        "total_score": 16
-    },
-    "security_concerns": [
-        {
-            "issue": "Missing access controls",
-            "severity": "high",
-            "description": "No apparent authorization mechanism",
-            "recommendation": "Implement role-based access control"
-        }
-    ],
-    "compliance_risks": [
-        {
-            "regulation": "Market Manipulation/Price Integrity",
-            "risk": "Oracle manipulation vulnerability",
-            "description": "Single-source oracles are vulnerable to manipulation",
-            "severity": "high",
-            "mitigation": "Use decentralized oracle networks with multiple sources"
-        },
-        {
-            "regulation": "Dispute Resolution",
-            "risk": "Dispute period and customer protection",
-            "description": "Timelocks may prevent timely dispute resolution",
-            "severity": "medium",
-            "mitigation": "Ensure adequate dispute resolution timeframes"
-        },
-        {
-            "regulation": "AML/CFT",
-            "risk": "Cross-border transaction monitoring",
-            "description": "Escrow mechanisms must comply with AML/CFT rules",
-            "severity": "high",
-            "mitigation": "Implement transaction monitoring and STR reporting"
-        }
-    ],
-    "recommendations": [
-        "Implement decentralized oracle network (not single-source)",
-        "Include circuit-breaker for extreme price movements",
-        "Document all timelocks and their business purpose",
-        "Ensure timelocks allow adequate dispute resolution periods",
-        "Engage legal counsel for final regulatory classification"
-    ]
-}
-
-# ============================================================================
-# STEP 3: CLAUDE AI COMPLIANCE ANALYSIS
-# ============================================================================
-
-CLAUDE_COMPLIANCE_ANALYSIS = """
-# EU REGULATORY COMPLIANCE ANALYSIS
-## Bitcoin Multi-Sig Wallet Covenant (Simplicity Language)
-
----
-
-## EXECUTIVE SUMMARY
-
-**Overall Risk Assessment: MEDIUM-LOW**
-
-This smart contract implements a sophisticated Bitcoin custody solution using Simplicity language. From an EU regulatory perspective, the primary concerns relate to custody arrangements, inheritance mechanisms, and potential classification as a financial service rather than the underlying cryptographic implementation.
-
----
-
-## 1. SIMPLICITY LANGUAGE TECHNICAL ASSESSMENT
-
-### 1.1 Combinator Usage ✅ SOUND
-
-The Simplicity language implementation demonstrates:
-
-- **Type Safety**: Proper use of strongly-typed combinators
-- **Compositional Logic**: Correct composition of primitive operations
-- **Deterministic Execution**: No non-deterministic behavior detected
-- **Resource Bounds**: Computation complexity appears bounded
-
-**Technical Risk: LOW**
-
-The use of Simplicity's mathematical foundations (categorical semantics) provides strong correctness guarantees not available in Script or EVM languages.
-
-### 1.2 Formal Verification Opportunity
-
-**Recommendation**: Consider formal verification using Simplicity's Coq proofs to mathematically prove:
-- Spending path exclusivity
-- Timelock enforcement correctness
-- Covenant recursion termination
-
----
-
-## 2. CRYPTOGRAPHIC SECURITY ANALYSIS
-
-### 2.1 BIP-340 Schnorr Signatures ✅ COMPLIANT
-
-**Assessment**: 
-- Uses standardized BIP-340 implementation
-- Proper signature verification logic
-- No custom cryptography (good practice)
-
-**Security Risk: LOW**
-
-### 2.2 Timelock Implementation (180-day inheritance)
-
-**Technical Correctness**: ✅ SOUND
-- Relative timelocks properly implemented
-- Prevents premature inheritance access
-- Standard Bitcoin consensus rules
-
-**Regulatory Consideration**:
-180-day period may conflict with certain inheritance laws in EU member states where forced heirship rules apply.
-
-**Compliance Risk: MEDIUM** (jurisdiction-dependent)
-
-### 2.3 Multi-Signature Configuration
-
-**Missing Information**: 
-- M-of-N threshold not specified in analysis
-- Key holder identification unclear
-- Geographic distribution of signers unknown
-
-**Required Clarification**: What is the signature threshold? (e.g., 2-of-3, 3-of-5)
-
----
-
-## 3. COVENANT ENFORCEMENT ANALYSIS
-
-### 3.1 Recursive Covenant Logic
-
-**Technical Soundness**: Appears correct based on pattern detection
-
-**Regulatory Concern**: 
-Recursive covenants create **perpetual restrictions** on Bitcoin UTXOs. This raises questions under:
-
-- **Property Rights**: EU law generally disfavors perpetual restrictions on property
-- **Forced Heirship**: Some EU jurisdictions (France, Germany, Spain) have mandatory inheritance rules that may conflict with programmatic restrictions
-
-**Legal Risk: MEDIUM**
-
-### 3.2 Script Hash Enforcement
-
-**Assessment**: Standard Bitcoin covenant pattern
-**Technical Risk: LOW**
-
----
-
-## 4. EU REGULATORY COMPLIANCE ASSESSMENT
-
-### 4.1 MICA (Markets in Crypto-Assets Regulation)
-
-**Applicability**: DEPENDS on operational model
-
-#### Scenario A: Self-Custody Tool (User controls keys)
-- **Classification**: Software tool, not a crypto-asset service
-- **MICA Application**: NOT APPLICABLE
-- **Risk**: LOW
-
-#### Scenario B: Custody Service Provider
-- **Classification**: Crypto-Asset Service Provider (CASP) under Article 3(1)(8)
-- **Requirements**:
-  - Authorization from competent authority (Article 59)
-  - Minimum capital: €150,000 (Article 67)
-  - Segregation of client assets (Article 70)
-  - Insurance or comparable guarantee (Article 71)
-- **Risk**: HIGH if providing custody without authorization
-
-**Critical Determination Needed**: Who controls the private keys?
-
-### 4.2 GDPR (Data Protection)
-
-**Identified Risks**:
-
-1. **Right to be Forgotten (Article 17)**
-   - Blockchain immutability conflicts with deletion rights
-   - Transaction metadata may contain personal data
-   - **Risk Level**: MEDIUM
-
-2. **Data Controller Identification**
-   - Multi-sig arrangement: Who is the data controller?
-   - Joint controller arrangement likely (Article 26)
-   - **Requirement**: Joint controller agreement needed
-
-**Mitigation Strategies**:
-- Minimize on-chain personal data
-- Use pseudonymous addressing
-- Implement off-chain identity management
-- Document GDPR compliance measures
-
-**Precedent**: *VKI v. Deutsche Telekom* (CJEU C-129/21) - blockchain operators can be data controllers
-
-### 4.3 Inheritance & Estate Law Compliance
-
-**Concern**: 180-day timelock and programmatic inheritance distribution
-
-**Applicable EU/Member State Law**:
-
-1. **EU Succession Regulation (650/2012)**
-   - Determines applicable inheritance law
-   - Generally: law of deceased's habitual residence
-   - **Conflict Risk**: Covenant may contradict forced heirship rules
-
-2. **Member State Forced Heirship**:
-   - France: 50-75% of estate to children (Article 913 Civil Code)
-   - Germany: 50% of estate reserved (BGB §2303)
-   - Spain: Two-thirds reserved for descendants (Civil Code Art. 806)
-   
-**Compliance Risk: HIGH in jurisdictions with forced heirship**
-
-**Recommendation**: 
-- Add flexible override mechanism for court orders
-- Include legal disclaimer about potential conflicts
-- Consider jurisdiction-specific deployment variants
-
-### 4.4 AML/CFT (6th Anti-Money Laundering Directive)
-
-**Risk Areas**:
-
-1. **Obliged Entity Status** (Article 2)
-   - If providing custody: YES, obliged entity
-   - If pure software tool: NO (per *Tornado Cash* precedent considerations)
-
-2. **Customer Due Diligence** (Article 13)
-   - **If Applicable**: KYC required for key holders
-   - Beneficial ownership identification needed
-   - Source of funds verification
-
-3. **Transaction Monitoring** (Article 46a)
-   - Large transactions (>€1,000) require enhanced monitoring
-   - Suspicious activity reporting obligations
-
-**Enforcement Precedent**:
-*BitMEX Case* (2021) - Cryptocurrency exchange fined €100M for AML violations including insufficient KYC
-
-**Current Risk Assessment**: MEDIUM-HIGH (depends on custody model)
-
-### 4.5 MiFID II Considerations
-
-**Potential Applicability**: If Bitcoin is considered a "financial instrument"
-
-**Current ECJ Position**: Bitcoin is NOT a financial instrument (*Hedqvist*, C-264/14)
-
-**Risk**: LOW (not applicable to Bitcoin)
-
-### 4.6 Payment Services Directive 2 (PSD2)
-
-**Assessment**: Not applicable
-**Reason**: No payment service provision, pure custody/covenant arrangement
-
----
-
-## 5. RISK ASSESSMENT MATRIX
-
-### 5.1 Technical Risks
-
-| Risk Category | Level | Mitigation |
-|--------------|-------|------------|
-| Cryptographic Implementation | LOW | Use standard libraries, audit code |
-| Timelock Logic | LOW | Formal verification recommended |
-| Covenant Recursion | LOW-MEDIUM | Test termination conditions |
-| Key Management | MEDIUM | Implement HSM storage, backup procedures |
-| Smart Contract Bugs | MEDIUM | Third-party security audit mandatory |
-
-### 5.2 Operational Risks
-
-| Risk Category | Level | Impact |
-|--------------|-------|--------|
-| Key Loss (Hot Key) | MEDIUM | Funds become inaccessible after timelock |
-| Key Compromise | HIGH | Unauthorized fund access |
-| Inheritance Trigger Failure | MEDIUM | Legitimate heirs cannot access funds |
-| Jurisdictional Conflicts | MEDIUM | Court orders may be unenforceable |
-| Service Provider Liability | HIGH | If operating as CASP without license |
-
-### 5.3 Regulatory Risks
-
-| Regulation | Risk Level | Primary Concern |
-|-----------|-----------|-----------------|
-| MICA | HIGH* | Unauthorized CASP operation |
-| GDPR | MEDIUM | Blockchain immutability vs. deletion rights |
-| 6AMLD | HIGH* | AML/KYC obligations |
-| Succession Regulation | MEDIUM | Forced heirship conflicts |
-| National Inheritance Law | MEDIUM-HIGH | Jurisdiction-specific restrictions |
-
-*Risk level depends on operational model (custody service vs. self-custody tool)
-
----
-
-## 6. DEPLOYMENT READINESS ASSESSMENT
-
-### 6.1 CRITICAL BLOCKERS (Must Address Before Launch)
-
-#### 🔴 BLOCKER 1: Business Model Classification
-**Issue**: Custody service vs. software tool determination
-**Action Required**: 
-- Legal opinion on MICA applicability
-- If CASP: Halt deployment until authorization obtained
-- If software tool: Document self-custody nature
-
-**Timeline**: 2-4 weeks for legal opinion
-
-#### 🔴 BLOCKER 2: AML/CFT Compliance Framework
-**Issue**: Potential obliged entity status unclear
-**Action Required**:
-- Implement KYC/AML procedures if applicable
-- Register with FIU (Financial Intelligence Unit)
-- Appoint MLRO (Money Laundering Reporting Officer)
-
-**Timeline**: 3-6 months if full compliance required
-
-#### 🔴 BLOCKER 3: Security Audit
-**Issue**: No independent security audit mentioned
-**Action Required**:
-- Smart contract audit by reputable firm (Trail of Bits, ChainSecurity, OpenZeppelin)
-- Cryptographic implementation review
-- Penetration testing
-
-**Timeline**: 6-8 weeks
-**Cost**: €50,000-150,000
-
-### 6.2 HIGH PRIORITY (Address Within 3 Months)
-
-#### 🟡 PRIORITY 1: GDPR Compliance Documentation
-**Actions**:
-- Data Protection Impact Assessment (DPIA)
-- Privacy Policy draft
-- Data Processing Agreements with any third parties
-- Joint controller agreements (if applicable)
-
-**Deliverables**:
-- DPIA report
-- Privacy by Design documentation
-- GDPR compliance checklist
-
-#### 🟡 PRIORITY 2: Legal Jurisdiction Analysis
-**Actions**:
-- Inheritance law analysis for target jurisdictions
-- Forced heirship compatibility assessment
-- Terms of Service with jurisdiction-specific disclaimers
-
-**Recommendation**: Consider geofencing for high-risk jurisdictions
-
-#### 🟡 PRIORITY 3: Operational Procedures
-**Required Documentation**:
-- Key ceremony procedures (key generation, backup)
-- Disaster recovery plan
-- Inheritance trigger verification process
-- Emergency response procedures
-- Incident reporting protocols
-
-### 6.3 MEDIUM PRIORITY (Address Within 6 Months)
-
-#### 🟢 Insurance Coverage
-- Professional indemnity insurance (€2-5M recommended)
-- Cybersecurity insurance
-- Directors & Officers liability
-
-#### 🟢 Formal Verification
-- Coq proofs for critical contract logic
-- Mathematical correctness guarantees
-- Publication in peer-reviewed venue (builds credibility)
-
-#### 🟢 User Documentation
-- Technical whitepaper
-- User guides with risk warnings
-- Legal disclaimers and limitations
-- Educational materials on inheritance planning
-
----
-
-## 7. COMPLIANCE ROADMAP
-
-### Phase 1: Legal Clarification (Weeks 1-4)
-- [ ] Retain specialized crypto/fintech law firm
-- [ ] Obtain business model classification opinion
-- [ ] Determine MICA applicability
-- [ ] Identify applicable AML obligations
-- [ ] Analyze target market jurisdictions
-
-**Budget**: €20,000-40,000
-
-### Phase 2: Technical Security (Weeks 5-12)
-- [ ] Commission smart contract audit
-- [ ] Implement audit recommendations
-- [ ] Penetration testing
-- [ ] Formal verification (optional but recommended)
-- [ ] Bug bounty program setup
-
-**Budget**: €75,000-200,000
-
-### Phase 3: Compliance Implementation (Weeks 13-26)
-**If CASP Status Applies**:
-- [ ] MICA authorization application
-- [ ] AML/CFT compliance program
-- [ ] KYC/CDD procedures
-- [ ] Transaction monitoring system
-- [ ] Staff training
-
-**Budget**: €150,000-500,000+ (authorization process)
-
-**If Software Tool Status**:
-- [ ] GDPR compliance documentation
-- [ ] Terms of Service finalization
-- [ ] Risk disclosure materials
-- [ ] User education program
-
-**Budget**: €30,000-60,000
-
-### Phase 4: Operational Deployment
-
----
-
-## 8. CONCLUSION
-
-The Bitcoin Multi-Sig Wallet Covenant demonstrates **sound technical implementation** in Simplicity language. However, **regulatory classification is critical**: whether this constitutes a financial service or software tool determines compliance obligations.
-
-### Key Takeaway
-**Deploy this contract only after:**
-1. Obtaining legal classification opinion
-2. Completing independent security audit
-3. Implementing jurisdiction-specific compliance measures
-
----
-
-**Recommended Next Steps**:
-1. Engage fintech law counsel (Priority: IMMEDIATE)
-2. Commission smart contract audit (Priority: Within 2 weeks)
-3. Develop GDPR compliance documentation (Priority: Within 1 month)
-4. Plan security and operational procedures (Priority: Parallel)
-"""
-
-# ============================================================================
-# COMPLETE TEST CASE STRUCTURE
-# ============================================================================
-
-COMPLETE_TEST_CASE = {
-    "test_id": "simplicity_multisig_covenant_001",
-    "test_name": "Multi-Sig Wallet Covenant - Complete Analysis",
-    "timestamp": datetime.now().isoformat(),
-    "status": "completed",
-    
-    # Input
-    "input": {
-        "contract": CONTRACT_INPUT,
-        "source_code": SIMPLICITY_SOURCE_CODE,
-        "witness_data": WITNESS_DATA
-    },
+    assert case.test_id == "simplicity_multisig_covenant_001"
+    assert case.status == "completed"
+    assert case.claude_analysis["overall_risk"] == "MEDIUM-LOW"
+    assert case.expected_response["contract_name"] == CONTRACT_INPUT["contract_name"]
+    assert case.expected_response["ready_for_deployment"] is False
+    assert case.expected_response["critical_actions_required"] == 3
     
-    # Step 1: Compilation
-    "compilation": {
-        "status": COMPILATION_RESULT["status"],
-        "success": True,
-        "bytecode_generated": "program" in COMPILATION_RESULT,
-        "witness_processed": "witness" in COMPILATION_RESULT
-    },
+    assert case.compilation.success
+    assert case.analysis == AnalysisSummary(
+        patterns_detected=3,
+        complexity_level="high",
+        security_concerns=1,
+        compliance_risks=3,
+        recommendations=5
+    )
+
+
+def test_test_case_is_read_only():
+    """Test the shared test case exposes attributes and rejects mutation"""
+    case = get_test_case()
+    assert case.raw_outputs["pattern_analysis"]["complexity"]["level"] == "high"
+    assert case.input["contract"]["language"] == "SimplicityHL"
+    assert isinstance(case.expected_response["next_steps"], tuple)
     
-    # Step 2: Analysis
-    "analysis": {
-        "patterns_detected": len(PATTERN_ANALYSIS_RESULT["patterns_detected"]),
-        "complexity_level": PATTERN_ANALYSIS_RESULT["complexity"]["level"],
-        "security_concerns": len(PATTERN_ANALYSIS_RESULT["security_concerns"]),
-        "compliance_risks": len(PATTERN_ANALYSIS_RESULT["compliance_risks"]),
-        "recommendations": len(PATTERN_ANALYSIS_RESULT["recommendations"])
-    },
-    
-    # Step 3: Claude Analysis
-    "claude_analysis": {
-        "overall_risk": "MEDIUM-LOW",
-        "technical_risk": "LOW",
-        "regulatory_risk": "MEDIUM-HIGH (jurisdiction-dependent)",
-        "critical_blockers": 3,
-        "high_priority_items": 3,
-        "compliance_roadmap_phases": 4,
-        "tokens_used": 3490
-    },
-    
-    # Expected Results for REST-API Testing
-    "expected_response": {
-        "status": "success",
-        "contract_name": "Bitcoin Multi-Sig Wallet Covenant",
-        "compilation_status": "success",
-        "analysis_status": "completed",
-        "claude_analysis_status": "completed",
-        "overall_assessment": "MEDIUM-LOW Risk",
-        "ready_for_deployment": False,
-        "critical_actions_required": 3,
-        "next_steps": [
-            "Obtain legal classification opinion (MICA applicability)",
-            "Commission independent security audit",
-            "Implement GDPR compliance documentation"
-        ]
-    },
-    
-    # Raw outputs for verification
-    "raw_outputs": {
-        "compilation_result": COMPILATION_RESULT,
-        "pattern_analysis": PATTERN_ANALYSIS_RESULT,
-        "claude_analysis": CLAUDE_COMPLIANCE_ANALYSIS
-    }
-}
-
-if __name__ == "__main__":
-    print("Test Case: Multi-Sig Wallet Covenant")
-    print(f"Test ID: {COMPLETE_TEST_CASE['test_id']}")
-    print(f"Status: {COMPLETE_TEST_CASE['status']}")
-    print(f"Compilation: {COMPLETE_TEST_CASE['compilation']['status']}")
-    print(f"Patterns Detected: {COMPLETE_TEST_CASE['analysis']['patterns_detected']}")
-    print(f"Claude Risk Assessment: {COMPLETE_TEST_CASE['claude_analysis']['overall_risk']}")
-    print(f"\nReady for REST-API testing: YES")
+    with pytest.raises(FrozenInstanceError):
+        case.status = "failed"
+    with pytest.raises(TypeError):
+        case.claude_analysis["overall_risk"] = "HIGH"
+    with pytest.raises(TypeError):
+        case.raw_outputs["pattern_analysis"]["complexity"]["level"] = "low"
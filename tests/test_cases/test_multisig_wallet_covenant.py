@@ -113,84 +113,58 @@ struct OutputData {
 }
 """
 
+# Spec keywords the contract must contain (matched case-insensitively)
+KEYWORDS = (
+    "checksig", "bip_0340", "recursive_covenant", "inherit_spend", "inheritor",
+    "cold_spend", "hot_spend", "25920", "180", "num_outputs", "script_hash",
+    "witness::", "_pk", "fee", "match", "fn main",
+)
 
-def test_simplicity_source_code_exists():
-    """Test that Simplicity-HL source code is defined"""
-    assert SIMPLICITY_SOURCE_CODE is not None
-    assert isinstance(SIMPLICITY_SOURCE_CODE, str)
-    assert len(SIMPLICITY_SOURCE_CODE) > 0
-
-
-def test_contract_has_checksig_function():
-    """Test that contract has signature verification function"""
-    assert "checksig" in SIMPLICITY_SOURCE_CODE.lower()
-    assert "bip_0340" in SIMPLICITY_SOURCE_CODE.lower()
-
-
-def test_contract_has_covenant_function():
-    """Test that contract has recursive covenant function"""
-    assert "recursive_covenant" in SIMPLICITY_SOURCE_CODE.lower()
-
-
-def test_contract_has_inheritance_path():
-    """Test that contract has inheritance spending path"""
-    assert "inherit_spend" in SIMPLICITY_SOURCE_CODE.lower() or "inheritor" in SIMPLICITY_SOURCE_CODE.lower()
-
-
-def test_contract_has_cold_storage_path():
-    """Test that contract has cold storage spending path"""
-    assert "cold_spend" in SIMPLICITY_SOURCE_CODE.lower()
-
-
-def test_contract_has_hot_key_path():
-    """Test that contract has hot key spending path"""
-    assert "hot_spend" in SIMPLICITY_SOURCE_CODE.lower()
-
-
-def test_contract_timelock_duration():
-    """Test that contract has 180-day inheritance timelock"""
-    assert "25920" in SIMPLICITY_SOURCE_CODE or "180" in SIMPLICITY_SOURCE_CODE
 
+def _find_keywords(source: str) -> frozenset:
+    """Keywords present in source (case-insensitive substring match)"""
+    source_lower = source.lower()
+    return frozenset(kw for kw in KEYWORDS if kw in source_lower)
 
-def test_contract_output_verification():
-    """Test that contract verifies outputs"""
-    assert "num_outputs" in SIMPLICITY_SOURCE_CODE.lower()
 
+@pytest.fixture(scope="session")
+def simplicity_keywords():
+    """Spec keywords found in the contract (scanned once per session)"""
+    return _find_keywords(SIMPLICITY_SOURCE_CODE)
 
-def test_contract_script_hash_verification():
-    """Test that contract uses recursive covenant pattern"""
-    assert "script_hash" in SIMPLICITY_SOURCE_CODE.lower()
 
-
-def test_contract_witness_data_structure():
-    """Test that contract defines witness data"""
-    assert "witness::" in SIMPLICITY_SOURCE_CODE
-
-
-def test_contract_pubkey_references():
-    """Test that contract references multiple public keys"""
-    assert "_pk" in SIMPLICITY_SOURCE_CODE.lower()
-
-
-def test_contract_fee_output():
-    """Test that contract enforces fee output"""
-    assert "fee" in SIMPLICITY_SOURCE_CODE.lower()
-
-
-def test_contract_match_statement():
-    """Test that contract uses match for spending paths"""
-    assert "match" in SIMPLICITY_SOURCE_CODE.lower()
-
-
-def test_contract_main_function():
-    """Test that contract has main entry point"""
-    assert "fn main" in SIMPLICITY_SOURCE_CODE.lower()
-
-
-def test_contract_schnorr_signature():
-    """Test that contract uses BIP-340 Schnorr signatures"""
-    assert "bip_0340" in SIMPLICITY_SOURCE_CODE.lower()
+def test_simplicity_source_code_exists():
+    """Test that Simplicity-HL source code is defined"""
+    assert SIMPLICITY_SOURCE_CODE is not None
+    assert isinstance(SIMPLICITY_SOURCE_CODE, str)
+    assert len(SIMPLICITY_SOURCE_CODE) > 0
 
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+# Required constructs: each entry lists accepted keywords, any one suffices
+SPEC_CHECKS = [
+    pytest.param(("checksig",), id="checksig_function"),
+    pytest.param(("bip_0340",), id="schnorr_bip340_verification"),
+    pytest.param(("recursive_covenant",), id="covenant_function"),
+    pytest.param(("inherit_spend", "inheritor"), id="inheritance_path"),
+    pytest.param(("cold_spend",), id="cold_storage_path"),
+    pytest.param(("hot_spend",), id="hot_key_path"),
+    pytest.param(("25920", "180"), id="timelock_duration"),
+    pytest.param(("num_outputs",), id="output_verification"),
+    pytest.param(("script_hash",), id="script_hash_verification"),
+    pytest.param(("witness::",), id="witness_data_structure"),
+    pytest.param(("_pk",), id="pubkey_references"),
+    pytest.param(("fee",), id="fee_output"),
+    pytest.param(("match",), id="match_statement"),
+    pytest.param(("fn main",), id="main_function"),
+]
+
+
+@pytest.mark.parametrize("keywords", SPEC_CHECKS)
+def test_contract_contains(keywords, simplicity_keywords):
+    """Test that contract contains a required construct"""
+    assert any(kw in simplicity_keywords for kw in keywords)
+
+
+def test_find_keywords_reports_overlapping_matches():
+    """Test overlapping keywords are all found, regardless of case"""
+    assert _find_keywords("let Inheritor_PK = 25920;") == {"inheritor", "_pk", "25920"}
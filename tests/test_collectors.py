@@ -11,151 +11,109 @@ import pytest
 from datetime import datetime
 
 
+REGULATORY_MODULE = "src.collectors.regulatory_collector"
+CASE_LAW_MODULE = "src.collectors.case_law_collector"
+BITCOIN_MODULE = "src.collectors.bitcoin_simplicity_collector"
+
+
+@pytest.fixture(scope="module")
+def regulatory_collector():
+    """One regulatory collector shared by this module"""
+    mod = pytest.importorskip(REGULATORY_MODULE)
+    return mod.RegulatoryCollector()
+
+
+@pytest.fixture(scope="module")
+def case_law_collector():
+    """One case law collector shared by this module"""
+    mod = pytest.importorskip(CASE_LAW_MODULE)
+    return mod.CaseLawCollector()
+
+
+@pytest.fixture(scope="module")
+def bitcoin_collector():
+    """One Bitcoin/Simplicity collector shared by this module"""
+    mod = pytest.importorskip(BITCOIN_MODULE)
+    return mod.BitcoinSimplicityCollector()
+
+
 def test_regulatory_collector_import():
     """Test that regulatory collector can be imported"""
-    try:
-        from src.collectors.regulatory_collector import RegulatoryCollector
-        assert RegulatoryCollector is not None
-    except ImportError:
-        pass
+    mod = pytest.importorskip(REGULATORY_MODULE)
+    assert mod.RegulatoryCollector is not None
 
 
 def test_case_law_collector_import():
     """Test that case law collector can be imported"""
-    try:
-        from src.collectors.case_law_collector import CaseLawCollector
-        assert CaseLawCollector is not None
-    except ImportError:
-        pass
+    mod = pytest.importorskip(CASE_LAW_MODULE)
+    assert mod.CaseLawCollector is not None
 
 
 def test_bitcoin_simplicity_collector_import():
     """Test that Bitcoin/Simplicity collector can be imported"""
-    try:
-        from src.collectors.bitcoin_simplicity_collector import BitcoinSimplicityCollector
-        assert BitcoinSimplicityCollector is not None
-    except ImportError:
-        pass
+    mod = pytest.importorskip(BITCOIN_MODULE)
+    assert mod.BitcoinSimplicityCollector is not None
 
 
-def test_regulatory_collector_initialization():
+def test_regulatory_collector_initialization(regulatory_collector):
     """Test regulatory collector initialization"""
-    try:
-        from src.collectors.regulatory_collector import RegulatoryCollector
-        collector = RegulatoryCollector()
-        assert collector is not None
-    except Exception as e:
-        pytest.skip(f"Regulatory collector init failed: {str(e)}")
+    assert regulatory_collector is not None
 
 
-def test_regulatory_frameworks_supported():
+def test_regulatory_frameworks_supported(regulatory_collector):
     """Test that collector supports required regulatory frameworks"""
-    try:
-        from src.collectors.regulatory_collector import RegulatoryCollector
-        collector = RegulatoryCollector()
-        required_frameworks = ['GDPR', 'MICA', 'MiFID2', 'PSD2']
-        for framework in required_frameworks:
-            # Collector should be able to fetch framework data
-            assert collector is not None
-    except Exception as e:
-        pytest.skip(f"Framework test failed: {str(e)}")
-
-
-def test_regulatory_collector_fetch():
+    required_frameworks = ['GDPR', 'MICA', 'MiFID2', 'PSD2']
+    for framework in required_frameworks:
+        # Collector should be able to fetch framework data
+        assert regulatory_collector is not None
+
+
+def test_regulatory_collector_fetch(regulatory_collector):
     """Test that regulatory collector can fetch data"""
-    try:
-        from src.collectors.regulatory_collector import RegulatoryCollector
-        collector = RegulatoryCollector()
-        # Should have fetch method
-        assert hasattr(collector, 'fetch') or hasattr(collector, 'collect')
-    except Exception as e:
-        pytest.skip(f"Fetch method test failed: {str(e)}")
+    # Should have fetch method
+    assert hasattr(regulatory_collector, 'fetch') or hasattr(regulatory_collector, 'collect')
 
 
-def test_case_law_collector_fetch():
+def test_case_law_collector_fetch(case_law_collector):
     """Test that case law collector can fetch enforcement actions"""
-    try:
-        from src.collectors.case_law_collector import CaseLawCollector
-        collector = CaseLawCollector()
-        assert hasattr(collector, 'fetch') or hasattr(collector, 'collect')
-    except Exception as e:
-        pytest.skip(f"Case law fetch test failed: {str(e)}")
+    assert hasattr(case_law_collector, 'fetch') or hasattr(case_law_collector, 'collect')
 
 
-def test_case_law_data_structure():
+def test_case_law_data_structure(case_law_collector):
     """Test that case law collector returns proper data structure"""
-    try:
-        from src.collectors.case_law_collector import CaseLawCollector
-        collector = CaseLawCollector()
-        # Mock test - collector should return list of cases
-        assert collector is not None
-    except Exception as e:
-        pytest.skip(f"Case law structure test failed: {str(e)}")
+    # Mock test - collector should return list of cases
+    assert case_law_collector is not None
 
 
-def test_bitcoin_collector_initialization():
+def test_bitcoin_collector_initialization(bitcoin_collector):
     """Test Bitcoin/Simplicity collector initialization"""
-    try:
-        from src.collectors.bitcoin_simplicity_collector import BitcoinSimplicityCollector
-        collector = BitcoinSimplicityCollector()
-        assert collector is not None
-    except Exception as e:
-        pytest.skip(f"Bitcoin collector init failed: {str(e)}")
+    assert bitcoin_collector is not None
 
 
-def test_bitcoin_collector_fetch_contracts():
+def test_bitcoin_collector_fetch_contracts(bitcoin_collector):
     """Test fetching Bitcoin/Simplicity contracts"""
-    try:
-        from src.collectors.bitcoin_simplicity_collector import BitcoinSimplicityCollector
-        collector = BitcoinSimplicityCollector()
-        assert hasattr(collector, 'fetch') or hasattr(collector, 'collect')
-    except Exception as e:
-        pytest.skip(f"Bitcoin fetch test failed: {str(e)}")
+    assert hasattr(bitcoin_collector, 'fetch') or hasattr(bitcoin_collector, 'collect')
 
 
-def test_collector_data_validation():
+def test_collector_data_validation(regulatory_collector):
     """Test that collectors validate fetched data"""
-    try:
-        from src.collectors.regulatory_collector import RegulatoryCollector
-        collector = RegulatoryCollector()
-        # Should have validation methods
-        assert hasattr(collector, 'validate') or hasattr(collector, 'is_valid')
-    except Exception as e:
-        pytest.skip(f"Validation test failed: {str(e)}")
+    # Should have validation methods
+    assert hasattr(regulatory_collector, 'validate') or hasattr(regulatory_collector, 'is_valid')
 
 
-def test_collector_error_handling():
+def test_collector_error_handling(regulatory_collector):
     """Test that collectors handle errors gracefully"""
-    try:
-        from src.collectors.regulatory_collector import RegulatoryCollector
-        collector = RegulatoryCollector()
-        # Should not raise exception on network errors
-        assert collector is not None
-    except Exception as e:
-        assert "collector" in str(e).lower() or True
+    # Construction must not raise on network errors (Weaviate is optional)
+    assert regulatory_collector is not None
 
 
-def test_collector_caching():
+def test_collector_caching(regulatory_collector):
     """Test that collectors support data caching"""
-    try:
-        from src.collectors.regulatory_collector import RegulatoryCollector
-        collector = RegulatoryCollector()
-        # Should have caching mechanism
-        assert hasattr(collector, 'cache') or hasattr(collector, 'use_cache')
-    except Exception as e:
-        pytest.skip(f"Caching test failed: {str(e)}")
+    # Should have caching mechanism
+    assert hasattr(regulatory_collector, 'cache') or hasattr(regulatory_collector, 'use_cache')
 
 
-def test_collector_update_timestamps():
+def test_collector_update_timestamps(regulatory_collector):
     """Test that collectors track data update timestamps"""
-    try:
-        from src.collectors.regulatory_collector import RegulatoryCollector
-        collector = RegulatoryCollector()
-        # Should track when data was last updated
-        assert hasattr(collector, 'last_updated') or hasattr(collector, 'get_timestamp')
-    except Exception as e:
-        pytest.skip(f"Timestamp test failed: {str(e)}")
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    # Should track when data was last updated
+    assert hasattr(regulatory_collector, 'last_updated') or hasattr(regulatory_collector, 'get_timestamp')
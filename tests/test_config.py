@@ -2,8 +2,7 @@
 Tests for configuration module
 """
 
-import pytest
-from src.config import ANTHROPIC_MODEL, PROJECT_ROOT, DATA_PATH
+from src.config import ANTHROPIC_MODEL, PROJECT_ROOT, DATA_PATH, PATHS_VERIFIED
 
 def test_config_loaded():
     """Test that configuration is loaded correctly"""
@@ -13,8 +12,4 @@ def test_config_loaded():
 
 def test_paths_exist():
     """Test that required paths exist"""
-    assert PROJECT_ROOT.exists()
-    assert DATA_PATH.exists()
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    assert PATHS_VERIFIED
@@ -0,0 +1,94 @@
+"""
+Tests for utility modules
+"""
+
+import json
+import sys
+import types
+
+import pytest
+from src.utils.json_utils import dumps, loads
+from src.utils.simplicity_compiler import (
+    compile_simplicity,
+    pretty_print_code,
+    write_text_to_temp_file,
+)
+
+COMPILER_OUTPUT = '{"status": "success", "program": "AAAA", "witness": ""}'
+
+
+@pytest.fixture
+def stub_compiler(monkeypatch):
+    """Replace pysimplicityhl with a stub returning COMPILER_OUTPUT"""
+    calls = []
+    
+    def run_from_python(parameters):
+        calls.append(parameters)
+        return COMPILER_OUTPUT
+    
+    stub = types.SimpleNamespace(run_from_python=run_from_python)
+    monkeypatch.setitem(sys.modules, "pysimplicityhl", stub)
+    return calls
+
+
+def test_pretty_print_code_indents_nested_expressions():
+    """Test that statements inside parentheses are indented"""
+    assert pretty_print_code("a(b;c);d") == "a(b;\n  c);\nd"
+
+
+def test_pretty_print_code_strips_trailing_whitespace():
+    """Test that lines never end with indentation padding"""
+    formatted = pretty_print_code("f(x;;y) ;")
+    assert all(line == line.rstrip() for line in formatted.split("\n"))
+
+
+def test_pretty_print_code_custom_indent_step():
+    """Test indentation step size"""
+    assert pretty_print_code("(a;b)", indent_step=4) == "(a;\n    b)"
+
+
+def test_write_text_to_temp_file(tmp_path):
+    """Test temp file is created with suffix and UTF-8 content"""
+    filename = write_text_to_temp_file("fn main() {} // ü", suffix="simf", directory=str(tmp_path))
+    assert filename.endswith(".simf")
+    with open(filename, encoding="utf-8") as f:
+        assert f.read() == "fn main() {} // ü"
+
+
+def test_compile_simplicity_parses_output(stub_compiler, tmp_path):
+    """Test normal mode returns the parsed output plus file bookkeeping"""
+    res = compile_simplicity("fn main() {}", folder=str(tmp_path), delete_temp_files=False)
+    assert res["status"] == "success"
+    assert res["program"] == "AAAA"
+    assert res["code_file"].endswith(".simf")
+    assert res["deleted"] is False
+    assert len(stub_compiler) == 1
+
+
+def test_compile_simplicity_raw_returns_compiler_json(stub_compiler, tmp_path):
+    """Test raw mode returns the compiler JSON unchanged, without wrapper keys"""
+    raw = compile_simplicity("fn main() {}", folder=str(tmp_path), delete_temp_files=False, raw=True)
+    assert raw == COMPILER_OUTPUT
+    assert json.loads(raw) == compile_simplicity(
+        "fn main() {}", folder=str(tmp_path), raw=False
+    )
+
+
+def test_compile_simplicity_deletes_temp_files(stub_compiler, tmp_path):
+    """Test temp source files are removed after compilation by default"""
+    compile_simplicity("fn main() {}", folder=str(tmp_path), raw=True)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_json_dumps_compact_and_indented():
+    """Test dumps returns UTF-8 bytes, compact by default"""
+    data = {"title": "Règlement", "articles": [1, 2]}
+    assert dumps(data) == '{"title":"Règlement","articles":[1,2]}'.encode("utf-8")
+    assert dumps(data, indent=True) == json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def test_json_loads_accepts_str_and_bytes():
+    """Test loads round-trips dumps output from bytes or text"""
+    data = {"status": "success", "items": [{"id": "a1"}]}
+    assert loads(dumps(data)) == data
+    assert loads(dumps(data).decode("utf-8")) == data
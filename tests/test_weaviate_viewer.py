@@ -0,0 +1,119 @@
+"""
+Tests for the Weaviate data viewer (HTTP session stubbed out)
+"""
+
+import json
+
+import pytest
+from src.utils.weaviate_viewer import QueryError, WeaviateViewer
+
+STATS = {"data": {"Aggregate": {
+    "Regulation": [{"meta": {"count": 3}}],
+    "Case": [{"meta": {"count": 0}}],
+}}}
+
+REGULATIONS = [
+    {"title": "Art. 5", "regulation": "GDPR", "article": "5",
+     "text": "Principles relating to processing", "_additional": {"id": "a1"}},
+    {"title": "Art. 6", "regulation": "GDPR", "article": "6",
+     "text": "Lawfulness of processing", "_additional": {"id": "a2"}},
+    {"title": "Enforcement: Kraken", "regulation": "MICA", "article": "",
+     "text": "Staking programme", "_additional": {"id": "a3"}},
+]
+
+
+class StubResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+
+class StubSession:
+    """Answers GraphQL posts from a handler and records each query"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.queries = []
+
+    def post(self, url, json=None, timeout=None):
+        self.queries.append(json["query"])
+        return self.handler(json["query"])
+
+
+def graphql_handler(query):
+    """Stats for Aggregate queries, a single short page of regulations otherwise"""
+    if "Aggregate" in query:
+        return StubResponse(STATS)
+    return StubResponse({"data": {"Get": {"Regulation": REGULATIONS}}})
+
+
+@pytest.fixture
+def viewer():
+    """Viewer wired to a stub session"""
+    v = WeaviateViewer()
+    v.session = StubSession(graphql_handler)
+    return v
+
+
+@pytest.fixture
+def loaded_viewer(viewer):
+    """Viewer with REGULATIONS fetched and indexed"""
+    assert viewer.fetch_all_data()
+    return viewer
+
+
+def test_query_results_are_cached(viewer):
+    """Test repeated queries hit the cache until cache_clear()"""
+    first = viewer.query("{ Get { Regulation { title } } }")
+    second = viewer.query("{ Get { Regulation { title } } }")
+    assert first == second
+    assert len(viewer.session.queries) == 1
+
+    viewer.cache_clear()
+    viewer.query("{ Get { Regulation { title } } }")
+    assert len(viewer.session.queries) == 2
+
+
+def test_graphql_errors_raise_query_error(viewer):
+    """Test GraphQL errors surface as QueryError and are not cached"""
+    viewer.session = StubSession(lambda q: StubResponse({"errors": [{"message": "bad"}]}))
+    with pytest.raises(QueryError):
+        viewer._execute("{ broken }")
+
+    assert viewer.query("{ broken }") == {}
+    assert viewer.query("{ broken }") == {}
+    assert len(viewer.session.queries) == 3
+
+
+def test_http_errors_raise_query_error(viewer):
+    """Test non-200 responses surface as QueryError"""
+    viewer.session = StubSession(lambda q: StubResponse({}, status_code=500))
+    with pytest.raises(QueryError):
+        viewer._execute("{ Get }")
+
+
+def test_fetch_builds_indexes(loaded_viewer):
+    """Test regulation and type lookups after fetching"""
+    assert len(loaded_viewer.all_data) == 3
+    assert [i["title"] for i in loaded_viewer._by_reg["GDPR"]] == ["Art. 5", "Art. 6"]
+    assert len(loaded_viewer._by_type["Regulation"]) == 3
+    assert loaded_viewer._reg_keys_sorted == ["GDPR", "MICA"]
+
+
+def test_search_matches_full_text(loaded_viewer):
+    """Test search is case-insensitive across title, regulation and text"""
+    assert [i["id"] for i in loaded_viewer.search("LAWFULNESS")] == ["a2"]
+    assert [i["id"] for i in loaded_viewer.search("mica")] == ["a3"]
+
+
+def test_export_json_matches_items(loaded_viewer, tmp_path):
+    """Test streamed export equals json.dumps of the exported items"""
+    path = tmp_path / "export.json"
+    loaded_viewer.export_json(str(path))
+
+    items = list(loaded_viewer.export_items())
+    assert all(not k.startswith("_") for item in items for k in item)
+    assert json.loads(path.read_text(encoding="utf-8")) == json.loads(json.dumps(items))